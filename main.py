@@ -1,180 +1,292 @@
+import atexit
+import dataclasses
+import functools
+import logging
+import logging.handlers
+import queue
+import orjson # Fast JSON for debug dumps (3-10x stdlib json)
 import yaml # For loading YAML configuration
-from datetime import datetime, timedelta # For date calculations
-from src.sheets_manager import get_authenticated_service, create_spreadsheet
-from src.flight_finder import find_flights
-from src.car_rental_finder import find_car_rentals
-from src.hotel_finder import find_hotels
+try:
+    # libyaml-backed loader; same safe-loading semantics, much faster parse.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError: # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date # For date calculations
+from pydantic import ValidationError
+from src.trip_config import TripConfig
+from src.profiling import report_timings
+from src.sheets_manager import get_authenticated_service, create_spreadsheet, write_trip_data_batch
+from src.flight_finder import FlightQuery, find_flights_batch
+from src.car_rental_finder import CarRentalQuery, find_car_rentals_batch
+from src.hotel_finder import HotelQuery, find_hotels_batch
 
 CONFIG_FILE = "trip_config.yaml"
+
+# (start offset, end offset, description prefix) per trip length option,
+# keyed by the config value. Day offsets are relative to the anchor Saturday;
+# a single dict lookup replaces the old if/elif chain and keeps new length
+# options a one-line addition.
+LENGTH_OPTIONS = {
+    "none": (-1, 1, "Weekend (Fri-Sun)"),
+    "friday_off": (-2, 1, "Friday Off (Thu-Sun)"),
+    "monday_off": (-1, 2, "Monday Off (Fri-Mon)"),
+}
 # FOLDER_ID for Google Drive can remain a constant here, or be moved to config if preferred
 FOLDER_ID = "1hDvTg-y2Nl3DPNvFaPzfdhVhxeSaoga6"
 
+logger = logging.getLogger(__name__)
+
+def setup_logging(level=logging.INFO):
+    """Configures root logging through a queue to a background listener.
+
+    Log calls in the hot loops only enqueue the record; the actual console
+    write (lock, format, flush) happens on the listener thread, so finder
+    loops never block on stdout I/O. Lazy %-style arguments mean formatting
+    is skipped entirely for filtered-out levels.
+    """
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    listener.start()
+    # Flush any queued records before the interpreter exits.
+    atexit.register(listener.stop)
+    logging.basicConfig(level=level, handlers=[logging.handlers.QueueHandler(log_queue)])
+    return listener
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Loads trip configuration from the YAML file."""
+    """Loads and validates trip configuration from the YAML file.
+
+    Returns a TripConfig model, so downstream code reads typed attributes
+    instead of dict.get calls and weekend dates arrive already parsed as
+    date objects. The result is cached, so repeat callers within one process
+    don't re-read and re-parse the YAML file.
+    """
     try:
         with open(CONFIG_FILE, 'r') as f:
-            config = yaml.safe_load(f)
-            print(f"Successfully loaded configuration from {CONFIG_FILE}")
-            return config
+            raw = yaml.load(f, Loader=_YamlLoader)
+        config = TripConfig.model_validate(raw or {})
+        logger.info("Successfully loaded configuration from %s", CONFIG_FILE)
+        return config
     except FileNotFoundError:
-        print(f"Error: Configuration file '{CONFIG_FILE}' not found. Please create it from the example.")
+        logger.error("Configuration file '%s' not found. Please create it from the example.", CONFIG_FILE)
         return None
     except yaml.YAMLError as e:
-        print(f"Error parsing YAML configuration file '{CONFIG_FILE}': {e}")
+        logger.error("Error parsing YAML configuration file '%s': %s", CONFIG_FILE, e)
+        return None
+    except ValidationError as e:
+        logger.error("Error validating configuration file '%s': %s", CONFIG_FILE, e)
         return None
     except Exception as e:
-        print(f"An unexpected error occurred while loading config: {e}")
+        logger.error("An unexpected error occurred while loading config: %s", e)
         return None
 
+def _option_fields(option):
+    """Flattens a finder result (dataclass record or legacy dict) into a list
+    of string cell values for a sheet row."""
+    if dataclasses.is_dataclass(option):
+        return [str(v) for v in dataclasses.astuple(option)]
+    return [str(v) for v in option.values()]
+
 def main():
-    print("Starting Trip Planner...")
+    logger.info("Starting Trip Planner...")
 
     config = load_config()
     if not config:
-        print("Exiting due to configuration loading error.")
+        logger.error("Exiting due to configuration loading error.")
         return
 
-    # For now, print the loaded config to verify
-    # print("\nLoaded Configuration:")
-    # import json
-    # print(json.dumps(config, indent=2))
-    # print("\n")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Loaded configuration:\n%s",
+                     orjson.dumps(config.model_dump(), option=orjson.OPT_INDENT_2, default=str).decode())
 
-    spreadsheet_title = config.get('output_sheet_name', "Default Trip Planning Sheet")
+    spreadsheet_title = config.output_sheet_name
     
     # Authenticate and get Google Sheets service client
     gs_client = get_authenticated_service()
     
     if not gs_client:
-        print("Exiting: Could not authenticate with Google Sheets.")
+        logger.error("Exiting: Could not authenticate with Google Sheets.")
         return
 
-    print("Successfully authenticated with Google Sheets.")
+    logger.info("Successfully authenticated with Google Sheets.")
 
     # Create or open the spreadsheet in the specified folder
     spreadsheet = create_spreadsheet(gs_client, spreadsheet_title, folder_id=FOLDER_ID)
 
     if not spreadsheet:
-        print(f"Exiting: Could not create or open spreadsheet: {spreadsheet_title}")
+        logger.error("Exiting: Could not create or open spreadsheet: %s", spreadsheet_title)
         return
 
-    print(f"Successfully accessed spreadsheet: {spreadsheet.title} ({spreadsheet.url})")
-    print("\n--- Starting Trip Option Calculations ---")
+    logger.info("Successfully accessed spreadsheet: %s (%s)", spreadsheet.title, spreadsheet.url)
+    logger.info("--- Starting Trip Option Calculations ---")
 
-    # Process trip dates
-    parsed_weekend_dates = []
-    for date_str in config.get('weekend_dates', []):
-        try:
-            # Assuming date_str is YYYY-MM-DD and represents a Saturday
-            parsed_weekend_dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-        except ValueError:
-            print(f"Warning: Invalid date format '{date_str}' in config. Skipping.")
-            continue
+    # Process trip dates. Each weekend date is already a date object (parsed
+    # and validated by TripConfig) and represents a Saturday.
+    parsed_weekend_dates = config.weekend_dates
 
-    trip_length_options = config.get('trip_length_options', [])
+    trip_length_options = config.trip_length_options
     all_trip_periods = []
 
     for sat_date in parsed_weekend_dates:
+        # Ordinal arithmetic and isoformat() (a C fast-path) replace the
+        # timedelta/strftime pairs previously built per length option.
+        sat_ord = sat_date.toordinal()
+        sat_str = date.fromordinal(sat_ord).isoformat()
         for length_option in trip_length_options:
-            start_date = None
-            end_date = None
-            description = ""
-
-            if length_option == "none": # Fri-Sun
-                start_date = sat_date - timedelta(days=1)
-                end_date = sat_date + timedelta(days=1)
-                description = f"Weekend (Fri-Sun): {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-            elif length_option == "friday_off": # Thu-Sun
-                start_date = sat_date - timedelta(days=2)
-                end_date = sat_date + timedelta(days=1)
-                description = f"Friday Off (Thu-Sun): {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-            elif length_option == "monday_off": # Fri-Mon
-                start_date = sat_date - timedelta(days=1)
-                end_date = sat_date + timedelta(days=2)
-                description = f"Monday Off (Fri-Mon): {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-            else:
-                print(f"Warning: Unknown trip length option '{length_option}'. Skipping.")
-                continue
-            
-            if start_date and end_date:
-                trip_info = {
-                    "description": description,
-                    "start_date_str": start_date.strftime("%Y-%m-%d"),
-                    "end_date_str": end_date.strftime("%Y-%m-%d"),
-                    "start_date_obj": start_date,
-                    "end_date_obj": end_date,
-                    "original_saturday": sat_date.strftime("%Y-%m-%d")
-                }
-                all_trip_periods.append(trip_info)
-                print(f"Generated trip option: {description}")
+            # TripConfig filtered out unknown options at load time, so every
+            # entry here has a LENGTH_OPTIONS spec.
+            delta_start, delta_end, desc_prefix = LENGTH_OPTIONS[length_option]
+            start_date = date.fromordinal(sat_ord + delta_start)
+            end_date = date.fromordinal(sat_ord + delta_end)
+
+            # Format each boundary date exactly once and reuse the strings.
+            start_str = start_date.isoformat()
+            end_str = end_date.isoformat()
+            description = f"{desc_prefix}: {start_str} to {end_str}"
+
+            trip_info = {
+                "description": description,
+                "start_date_str": start_str,
+                "end_date_str": end_str,
+                "start_date_obj": start_date,
+                "end_date_obj": end_date,
+                "original_saturday": sat_str
+            }
+            all_trip_periods.append(trip_info)
+            logger.info("Generated trip option: %s", description)
 
     if not all_trip_periods:
-        print("No valid trip periods generated. Check config for weekend_dates and trip_length_options.")
+        logger.error("No valid trip periods generated. Check config for weekend_dates and trip_length_options.")
         return
 
-    print(f"\nTotal trip options generated: {len(all_trip_periods)}")
-    print("--- Starting to fetch details for each trip option ---")
+    logger.info("Total trip options generated: %d", len(all_trip_periods))
+    logger.info("--- Starting to fetch details for each trip option ---")
+
+    # Build the full batch of queries up front, so each finder is invoked
+    # exactly once per run. Each query list has a parallel list of trip
+    # descriptions used to group the results back onto their trip option.
+    # Hoist config reads out of the per-trip loop; these are invariant
+    # across trip options, so fetch each exactly once.
+    destinations = tuple(config.destination_airport_options)
+    travelers = config.travelers
+    preferred_brands = tuple(config.preferred_hotel_brands)
+    fallback_options = config.fallback_hotel_options
+
+    # Prepare hotel search locations (identical for every trip option):
+    # destination airports first, then any park areas with a search area set.
+    hotel_search_locations = tuple(
+        [{'type': 'airport', 'location_name': airport_code} for airport_code in destinations]
+        + [{'type': 'park_area', 'location_name': park_info.hotel_search_area, 'park_name': park_info.name}
+           for park_info in config.destination_parks
+           if park_info.hotel_search_area]
+    )
+
+    flight_queries, flight_descs = [], []
+    car_queries, car_descs = [], []
+    hotel_queries, hotel_descs = [], []
 
-    all_trip_data_for_sheet = [] # Will hold data for all options
+    for trip_period in all_trip_periods:
+        desc = trip_period['description']
 
-    for i, trip_period in enumerate(all_trip_periods):
-        print(f"\nProcessing Trip Option {i+1}/{len(all_trip_periods)}: {trip_period['description']}")
+        for traveler in travelers:
+            flight_queries.append(FlightQuery(
+                traveler_name=traveler.name,
+                origin_airports=tuple(traveler.origin_airport_options),
+                destination_airports=destinations,
+                depart_date=trip_period['start_date_str'],
+                return_date=trip_period['end_date_str'],
+                budget=traveler.budget,
+                preferred_times=traveler.preferred_times,
+            ))
+            flight_descs.append(desc)
 
-        current_option_flights = []
-        for traveler in config.get('travelers', []):
-            flights = find_flights(trip_period, traveler, config.get('destination_airport_options', []))
-            if flights:
-                current_option_flights.extend(flights)
-            # else: # Handle no flights found for a traveler if needed
-            #     print(f"    No flights found for {traveler['name']}")
-        
         # For car rentals, we'd typically search at each potential destination airport
         # and then the user would choose one that aligns with their chosen flights.
         # For now, let's assume we search at all destination_airport_options.
-        car_rentals = find_car_rentals(trip_period, config.get('destination_airport_options', []))
-
-        # Prepare hotel search locations
-        hotel_search_locations = []
-        # 1. Add destination airports
-        for airport_code in config.get('destination_airport_options', []):
-            hotel_search_locations.append({'type': 'airport', 'location_name': airport_code})
-        
-        # 2. Add park-specific search areas if defined in config
-        for park_info in config.get('destination_parks', []):
-            search_area = park_info.get('hotel_search_area')
-            if search_area: # Only add if hotel_search_area is provided and not empty
-                hotel_search_locations.append({'type': 'park_area', 'location_name': search_area, 'park_name': park_info.get('name')})
-
-        hotels = find_hotels(
-            trip_period,
-            hotel_search_locations,
-            config.get('preferred_hotel_brands', []),
-            config.get('fallback_hotel_options', "Any")
-        )
+        car_queries.append(CarRentalQuery(
+            pickup_airports=destinations,
+            pickup_date=trip_period['start_date_str'],
+            dropoff_date=trip_period['end_date_str'],
+        ))
+        car_descs.append(desc)
+
+        hotel_queries.append(HotelQuery(
+            search_locations=hotel_search_locations,
+            check_in_date=trip_period['start_date_str'],
+            check_out_date=trip_period['end_date_str'],
+            preferred_brands=preferred_brands,
+            fallback_options=fallback_options,
+        ))
+        hotel_descs.append(desc)
+
+    # One batched call per finder; the three batches still run concurrently.
+    flights_by_desc = defaultdict(list)
+    cars_by_desc = defaultdict(list)
+    hotels_by_desc = defaultdict(list)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        batch_futures = {
+            executor.submit(find_flights_batch, flight_queries): (flight_descs, flights_by_desc, "flight"),
+            executor.submit(find_car_rentals_batch, car_queries): (car_descs, cars_by_desc, "car rental"),
+            executor.submit(find_hotels_batch, hotel_queries): (hotel_descs, hotels_by_desc, "hotel"),
+        }
+        for future in as_completed(batch_futures):
+            descs, results_by_desc, label = batch_futures[future]
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                logger.error("  Error during batched %s search: %s", label, e)
+                continue
+            for desc, results in zip(descs, batch_results):
+                if results:
+                    results_by_desc[desc].extend(results)
+
+    total_options = len(all_trip_periods)
+
+    # One preallocated slot of sheet rows per trip option and section. The
+    # option count is known up front, so index writes avoid append-time list
+    # growth and stay thread-safe if this loop is ever populated in parallel.
+    flights_slots = [()] * total_options
+    cars_slots = [()] * total_options
+    hotels_slots = [()] * total_options
+
+    for i, trip_period in enumerate(all_trip_periods, start=1):
+        desc = trip_period['description']
+        logger.info("Processing Trip Option %d/%d: %s", i, total_options, desc)
+
+        current_option_flights = flights_by_desc.get(desc, [])
+        car_rentals = cars_by_desc.get(desc, [])
+        hotels = hotels_by_desc.get(desc, [])
 
         # For now, just print the collected dummy data for this trip option
-        print(f"  Collected for {trip_period['description']}:")
+        logger.info("  Collected for %s:", desc)
         if current_option_flights:
-            print(f"    Flights: {current_option_flights}")
+            logger.info("    Flights: %s", current_option_flights)
         if car_rentals:
-            print(f"    Car Rentals: {car_rentals}")
+            logger.info("    Car Rentals: %s", car_rentals)
         if hotels:
-            print(f"    Hotels: {hotels}")
-        
-        # We would store this collected data for later writing to the sheet
-        trip_data_summary = {
-            "trip_description": trip_period['description'],
-            "start_date": trip_period['start_date_str'],
-            "end_date": trip_period['end_date_str'],
-            "flights_info": current_option_flights,
-            "car_rentals_info": car_rentals,
-            "hotels_info": hotels
-        }
-        all_trip_data_for_sheet.append(trip_data_summary)
+            logger.info("    Hotels: %s", hotels)
+
+        # Flatten each result into sheet rows now, so writing is one batched
+        # update at the end instead of a request per trip option.
+        row_prefix = [desc, trip_period['start_date_str'], trip_period['end_date_str']]
+        flights_slots[i - 1] = [row_prefix + _option_fields(flight) for flight in current_option_flights]
+        cars_slots[i - 1] = [row_prefix + _option_fields(rental) for rental in car_rentals]
+        hotels_slots[i - 1] = [row_prefix + _option_fields(hotel) for hotel in hotels]
+
+    # Concatenate the per-option slots into the final row lists, in trip order.
+    flights_rows = [row for rows in flights_slots for row in rows]
+    cars_rows = [row for rows in cars_slots for row in rows]
+    hotels_rows = [row for rows in hotels_slots for row in rows]
 
-    print("\n--- All trip options processed (with dummy data) ---")
-    # print(f"Total data collected for sheet: {json.dumps(all_trip_data_for_sheet, indent=2)}") 
-    print("Next step: Implement actual data fetching in finder modules and write to Google Sheet.")
+    logger.info("--- All trip options processed (with dummy data) ---")
+    write_trip_data_batch(spreadsheet, flights_rows, cars_rows, hotels_rows)
+    report_timings() # No-op unless TRIP_PROFILE=1
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    setup_logging()
+    main()
\ No newline at end of file
@@ -1,8 +1,33 @@
 # src/car_rental_finder.py
+import logging
 import time
+from dataclasses import dataclass
+from src.profiling import timed
+
+logger = logging.getLogger(__name__)
 
 # Placeholder for actual car rental searching logic
 
+@dataclass
+class CarRentalQuery:
+    """One car rental search: pickup airports and a date range."""
+    pickup_airports: tuple
+    pickup_date: str
+    dropoff_date: str
+
+@dataclass(slots=True)
+class CarRentalOption:
+    """A single car rental result. Slotted, so hundreds of results stay cheap
+    and sheet rows can be produced with dataclasses.astuple."""
+    pickup_location: str
+    pickup_date: str
+    dropoff_date: str
+    car_type: str
+    rental_company: str
+    price_total: str
+    price_per_day: str
+    booking_link: str
+
 def find_car_rentals(trip_period, destination_airports):
     """Placeholder function to find car rentals.
 
@@ -11,10 +36,11 @@ def find_car_rentals(trip_period, destination_airports):
         destination_airports (list): List of airport codes where car might be picked up.
 
     Returns:
-        list: A list of dummy car rental option dictionaries.
+        list: A list of dummy CarRentalOption records.
     """
-    print(f"  [CarRentalFinder] Searching car rentals at {destination_airports}")
-    print(f"                    Dates: {trip_period['start_date_str']} to {trip_period['end_date_str']}")
+    # Lazy %-style args: no string interpolation happens unless DEBUG is on.
+    logger.debug("  [CarRentalFinder] Searching car rentals at %s", destination_airports)
+    logger.debug("                    Dates: %s to %s", trip_period['start_date_str'], trip_period['end_date_str'])
     
     # Simulate API call or scraping delay
     # time.sleep(0.1)
@@ -22,22 +48,44 @@ def find_car_rentals(trip_period, destination_airports):
     rentals_found = []
     # Simulate finding one option for the first destination airport
     if destination_airports:
-        rentals_found.append({
-            "pickup_location": destination_airports[0],
-            "pickup_date": trip_period['start_date_str'],
-            "dropoff_date": trip_period['end_date_str'],
-            "car_type": "Mid-size SUV",
-            "rental_company": "DummyRentals",
-            "price_total": "$200 - $350",
-            "price_per_day": "$50 - $70",
-            "booking_link": "https://cars.example.com/dummy_link"
-        })
-        print(f"    -> Found dummy car rental at {destination_airports[0]}")
+        rentals_found.append(CarRentalOption(
+            pickup_location=destination_airports[0],
+            pickup_date=trip_period['start_date_str'],
+            dropoff_date=trip_period['end_date_str'],
+            car_type="Mid-size SUV",
+            rental_company="DummyRentals",
+            price_total="$200 - $350",
+            price_per_day="$50 - $70",
+            booking_link="https://cars.example.com/dummy_link"
+        ))
+        logger.debug("    -> Found dummy car rental at %s", destination_airports[0])
     else:
-        print("    -> No destination airports specified for car rental search.")
+        logger.warning("    -> No destination airports specified for car rental search.")
     
     return rentals_found
 
+def find_car_rentals_batch(queries):
+    """Resolves a batch of CarRentalQuery objects in one call.
+
+    One batched call per run (instead of one call per trip option) keeps the
+    request count flat once a real rental API replaces the placeholder.
+
+    Args:
+        queries (list[CarRentalQuery]): All searches to perform.
+
+    Returns:
+        list: One result list per query, in the same order as `queries`.
+    """
+    all_results = []
+    with timed("find_car_rentals"):
+        for query in queries:
+            trip_period = {
+                'start_date_str': query.pickup_date,
+                'end_date_str': query.dropoff_date,
+            }
+            all_results.append(find_car_rentals(trip_period, list(query.pickup_airports)))
+    return all_results
+
 if __name__ == '__main__':
     print("Testing car_rental_finder.py...")
     sample_trip_period = {
@@ -1,7 +1,20 @@
 # src/flight_finder.py
+import atexit
+import logging
+import os
 import time
 import json
-import math # Added for rounding
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+from dataclasses import dataclass, field
+from itertools import product
+import orjson
+from urllib.parse import quote_plus
+from diskcache import Cache
+from src.profiling import timed
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
@@ -9,12 +22,168 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 
+logger = logging.getLogger(__name__)
+
+# Keep webdriver-manager out of the per-search hot path: prefer its local
+# driver cache over an online version probe, and silence its logging.
+os.environ.setdefault('WDM_LOCAL', '1')
+os.environ.setdefault('WDM_LOG_LEVEL', '0')
+
+# Resolved chromedriver path, cached for the life of the process so only the
+# first get_webdriver call pays the ChromeDriverManager version check.
+_CHROMEDRIVER_PATH = None
+
 # --- Constants ---
 GOOGLE_FLIGHTS_URL = "https://www.google.com/travel/flights"
 
+def _build_deeplink_url(origin_ap, dest_ap, start_date_str, end_date_str):
+    """Builds a Google Flights deep-link URL that encodes the whole query.
+
+    Navigating straight to this URL replaces the dozen-plus Selenium round
+    trips of typing airports, clicking suggestions, and entering dates; the
+    page lands directly on (or redirects to) the results view.
+    """
+    query = f"Flights from {origin_ap} to {dest_ap} on {start_date_str} through {end_date_str}"
+    return f"{GOOGLE_FLIGHTS_URL}?q={quote_plus(query)}"
+
+# --- Locators ---
+# Hoisted to module level so every (By, selector) tuple is built exactly once
+# and reused across searches, instead of re-assembling the long selector
+# strings at each find_element/wait call site.
+#
+# CSS selectors wherever the locator translates: the browser's native
+# querySelector handles these much faster than XPath evaluation, which
+# matters on the large Google Flights results DOM. XPath remains only for
+# locators that need text matching or descendant predicates CSS can't express.
+CONSENT_BTN = (By.XPATH, "//button[.//span[contains(text(),'Accept all') or contains(text(),'Reject all') or contains(text(),'I agree')]]")
+REJECT_ALL_BTN = (By.XPATH, "//button[.//span[contains(text(),'Reject all')]]")
+ORIGIN_INPUT = (By.CSS_SELECTOR, "input[aria-label='Where from?']")
+# Trailing space in the aria-label is real (observed in the live HTML).
+DEST_INPUT = (By.CSS_SELECTOR, "input[aria-label='Where to? ']")
+DEPARTURE_DATE_INPUT = (By.CSS_SELECTOR, "input[aria-label='Departure'][placeholder='Departure']")
+RETURN_DATE_INPUT = (By.CSS_SELECTOR, "input[aria-label='Return'][placeholder='Return']")
+DATES_DONE_BTN = (By.CSS_SELECTOR, "button[aria-label='Done. ']")
+SEARCH_BTN = (By.CSS_SELECTOR, "button[aria-label='Search'][jsname='vLv7Lb']")
+RESULTS_ITEM = (By.CSS_SELECTOR, "div.JMc5Xc")
+# The aria-label prefix alone identifies the filter buttons; no need for the
+# old child-span text predicate.
+STOPS_BTN = (By.CSS_SELECTOR, "button[aria-label^='Stops']")
+NONSTOP_OPTION = (By.XPATH, "//div[contains(@class, 'VfPpkd-GCYh9b') and .//input[@aria-label='Nonstop only' and @type='radio']]")
+NONSTOP_RADIO = (By.CSS_SELECTOR, "input[aria-label='Nonstop only']") # relative to NONSTOP_OPTION
+PRICE_BTN = (By.CSS_SELECTOR, "button[aria-label^='Price']")
+PRICE_INPUT = (By.CSS_SELECTOR, "input[type='range'][aria-label='Maximum price']")
+PRICE_TRACK = (By.CSS_SELECTOR, "div.VfPpkd-SxecR[jscontroller='tbQzUe'][jsname='SxecR']")
+PRICE_THUMB = (By.XPATH, "//div[@jsname='PFprWc' and .//input[@aria-label='Maximum price']]")
+TIMES_BTN = (By.CSS_SELECTOR, "button[aria-label^='Times']")
+
+# Times filter dialog and its four slider controls. Everything is prebuilt
+# once at import, so the Times block does no per-call XPath string
+# concatenation and the four update sites collapse into one loop.
+TIMES_DIALOG_XPATH = "//div[@aria-modal='true' and @role='dialog' and .//h2[text()='Times']]"
+TIMES_DIALOG_READY = (By.CSS_SELECTOR, "input[aria-label='Earliest departure']")
+_DEPARTURE_TRACK_XPATH = TIMES_DIALOG_XPATH + "//div[.//span[text()='Departure'] and descendant::input[@aria-label='Earliest departure']]//div[@jscontroller='tbQzUe' and contains(@class, 'VfPpkd-SxecR')][1]"
+_ARRIVAL_TRACK_XPATH = TIMES_DIALOG_XPATH + "//div[.//span[text()='Arrival'] and descendant::input[@aria-label='Earliest arrival']]//div[@jscontroller='tbQzUe' and contains(@class, 'VfPpkd-SxecR')][1]"
+
+def _times_slider_spec(aria_label, track_xpath, slider_label):
+    """Prebuilt _set_slider_thumb_value kwargs for one Times-dialog slider.
+
+    Only one Times dialog exists at a time and its presence is confirmed
+    before any of these run, so the input and thumb use plain CSS attribute
+    selectors (Blink's querySelector fast path) instead of re-matching the
+    dialog's text() predicate on every lookup. The dialog root and the
+    tracks stay XPath: both need text() matches CSS cannot express.
+    """
+    return {
+        "thumb_locator": (By.CSS_SELECTOR, f"div[jsname='PFprWc']:has(input[aria-label='{aria_label}'])"),
+        "input_locator": (By.CSS_SELECTOR, f"input[aria-label='{aria_label}']"),
+        "track_locator": (By.XPATH, track_xpath),
+        "slider_label": slider_label,
+    }
+
+# Keyed by the preferred_times config key each slider is driven from.
+TIMES_SLIDERS = {
+    "outbound_departure_earliest": _times_slider_spec("Earliest departure", _DEPARTURE_TRACK_XPATH, "Outbound Earliest Departure"),
+    "outbound_departure_latest": _times_slider_spec("Latest departure", _DEPARTURE_TRACK_XPATH, "Outbound Latest Departure"),
+    "outbound_arrival_earliest": _times_slider_spec("Earliest arrival", _ARRIVAL_TRACK_XPATH, "Outbound Earliest Arrival"),
+    "outbound_arrival_latest": _times_slider_spec("Latest arrival", _ARRIVAL_TRACK_XPATH, "Outbound Latest Arrival"),
+}
+
+@functools.lru_cache(maxsize=128)
+def suggestion_locator(airport_code, airport_only=False):
+    """Locator for an airport suggestion in the open listbox.
+
+    data-type='1' restricts matches to airports (vs. cities) when
+    airport_only is set. Cached, so repeat searches over the same handful of
+    airports reuse the built tuple instead of re-formatting the selector.
+    """
+    if airport_only:
+        return (By.CSS_SELECTOR, f"li[role='option'][data-code='{airport_code}'][data-type='1']")
+    return (By.CSS_SELECTOR, f"li[role='option'][data-code='{airport_code}']")
+
+# On-disk result cache keyed by the full query signature. Identical searches
+# (same traveler, route, dates) recur across trip options that share a weekend
+# and across re-runs; hitting the cache skips the whole browser session.
+# Flight prices go stale quickly, so entries expire after an hour.
+_CACHE_EXPIRE_SECONDS = 3600
+_cache = Cache(".finder_cache")
+
+def _encode_cached_option(obj):
+    """orjson fallback encoder for cached result payloads."""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Cannot cache object of type {type(obj)!r}")
+
+def _query_cache_key(trip_period, traveler_info, destination_airports):
+    """Builds a stable, hashable cache key for one flight search."""
+    return (
+        traveler_info.get('name'),
+        tuple(traveler_info.get('origin_airport_options') or ()),
+        traveler_info.get('budget'),
+        tuple(sorted((traveler_info.get('preferred_times') or {}).items())),
+        tuple(destination_airports),
+        trip_period['start_date_str'],
+        trip_period['end_date_str'],
+    )
+
+# --- Batch query descriptor ---
+@dataclass
+class FlightQuery:
+    """One flight search: a traveler, a route, and a date range.
+
+    Batching queries into a single `find_flights_batch` call keeps the number
+    of outbound provider requests independent of how many trip options are
+    being evaluated (one batched call instead of one call per combination).
+    """
+    traveler_name: str
+    origin_airports: tuple
+    destination_airports: tuple
+    depart_date: str
+    return_date: str
+    budget: int = None
+    preferred_times: dict = field(default_factory=dict)
+
+@dataclass(slots=True)
+class FlightOption:
+    """A single flight result. Slotted, so large fan-outs stay cheap and
+    sheet rows can be produced with dataclasses.astuple.
+
+    The Selenium flow still returns status dicts until result extraction is
+    implemented; once it is, each scraped itinerary becomes one FlightOption.
+    """
+    traveler_name: str
+    origin: str
+    destination: str
+    depart: str
+    ret: str
+    airline: str
+    price: str
+    stops: str
+    duration: str
+    booking_link: str
+
 # --- Selenium WebDriver Setup ---
 def get_webdriver(headless=True):
     """Initializes and returns a Selenium Chrome WebDriver.
@@ -29,44 +198,349 @@ def get_webdriver(headless=True):
     """
     options = webdriver.ChromeOptions()
     if headless:
-        options.add_argument("--headless")
+        options.add_argument("--headless=new") # Modern headless: same engine as headful
+    # Don't block in driver.get at all: 'none' returns as soon as navigation
+    # starts, so not even DOMContentLoaded is waited for. Every flow in this
+    # module already waits explicitly for the specific element it needs next
+    # (results item, consent button, origin input), and those appear well
+    # before the tail of lazy-loaded trackers finishes.
+    options.page_load_strategy = 'none'
+    # The search flow never looks at images; skip downloading them entirely
+    # (both the Blink switch and the content-settings pref, belt and braces).
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-extensions")
+    # Skip background feature startup work that a scripted session never uses.
+    options.add_argument("--disable-features=Translate,MediaRouter")
+    # A smaller viewport means less layout/raster work per filter re-render;
+    # the results list renders the same either way.
+    options.add_argument("--window-size=1280,900")
     options.add_argument("--no-sandbox") # Important for running in some environments
     options.add_argument("--disable-dev-shm-usage") # Overcome limited resource problems
     options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
     options.add_experimental_option('excludeSwitches', ['enable-logging']) # Suppress DevTools logging
     try:
-        service = ChromeService(ChromeDriverManager().install())
+        global _CHROMEDRIVER_PATH
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        service = ChromeService(_CHROMEDRIVER_PATH)
         driver = webdriver.Chrome(service=service, options=options)
+        # Block trackers, fonts, and image formats at the network layer via
+        # CDP. None of these affect the selectors we query, and together they
+        # account for a large share of the bytes and round-trips behind the
+        # initial page load. Works in both headful and headless modes.
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                "*.googletagmanager.com/*", "*google-analytics.com/*",
+                "*doubleclick.net/*", "*.woff2", "*.woff", "*.ttf",
+                "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp"]})
+        except Exception as e_cdp:
+            # CDP is Chrome-specific sugar; a failure here shouldn't stop the search.
+            logger.warning("    Could not set CDP network blocking (continuing without): %s", e_cdp)
+        # Explicit waits cover every lookup in this module; a zero implicit
+        # wait makes probing find_elements calls return immediately and
+        # avoids the compounding implicit+explicit wait slowdown.
+        driver.implicitly_wait(0)
         return driver
     except Exception as e:
-        print(f"Error initializing WebDriver: {e}")
-        print("Please ensure Google Chrome is installed.")
-        print("If issues persist, you might need to check ChromeDriver compatibility or network access for webdriver-manager.")
+        logger.warning("Error initializing WebDriver: %s", e)
+        logger.debug("Please ensure Google Chrome is installed.")
+        logger.debug("If issues persist, you might need to check ChromeDriver compatibility or network access for webdriver-manager.")
         return None
 
+# JS that sets a range input through the native HTMLInputElement value setter
+# and fires bubbling input/change events. Google Flights' sliders are
+# framework-controlled components that shadow .value, so the native setter
+# trick is what makes the page actually register the new value.
+_SET_RANGE_VALUE_JS = (
+    "const el=arguments[0]; const v=arguments[1];"
+    "const setter=Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype,'value').set;"
+    "setter.call(el, v);"
+    "el.dispatchEvent(new Event('input',{bubbles:true}));"
+    "el.dispatchEvent(new Event('change',{bubbles:true}));"
+)
+
+# Applies a whole batch of sliders in one script call. Takes
+# [{selector, value}, ...], resolves each input via querySelector, clamps the
+# value to the input's min/max, sets it through the native setter and fires
+# input/change. Returns the selectors that failed to resolve or stick, so the
+# caller can fall back to the per-thumb path for just those. One round trip
+# replaces the several synchronous WebDriver commands each thumb would cost.
+_APPLY_SLIDERS_JS = (
+    "const entries=arguments[0]; const failed=[];"
+    "const setter=Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype,'value').set;"
+    "for (const e of entries){"
+    "  const el=document.querySelector(e.selector);"
+    "  if(!el){failed.push(e.selector);continue;}"
+    "  const v=Math.max(+el.min,Math.min(+el.max,e.value));"
+    "  setter.call(el,v);"
+    "  el.dispatchEvent(new Event('input',{bubbles:true}));"
+    "  el.dispatchEvent(new Event('change',{bubbles:true}));"
+    "  if(+el.value!==v){failed.push(e.selector);}"
+    "}"
+    "return failed;"
+)
+
+def _apply_sliders_batch(driver, slider_payload):
+    """Runs _APPLY_SLIDERS_JS over `[{'selector':..., 'value':...}, ...]`.
+
+    Returns the set of input selectors that did not take the value (or all of
+    them if the script itself failed), for per-thumb fallback handling.
+    """
+    try:
+        return set(driver.execute_script(_APPLY_SLIDERS_JS, slider_payload) or [])
+    except Exception as e_batch:
+        logger.debug("      Batched slider script failed (%s); falling back per thumb.", e_batch)
+        return {entry["selector"] for entry in slider_payload}
+
+def _cdp_drag(driver, element, x_offset):
+    """Drags an element horizontally via CDP Input.dispatchMouseEvent.
+
+    Three synchronous calls (press, move, release) replace the ActionChains
+    drag, which routes the same gesture through the W3C Actions API at a
+    JSON round-trip per step. Returns False when the CDP endpoint is
+    unavailable so the caller can fall back to ActionChains.
+    """
+    try:
+        location = element.location_once_scrolled_into_view
+        size = element.size
+        x0 = int(location['x'] + size['width'] / 2)
+        y0 = int(location['y'] + size['height'] / 2)
+        driver.execute_cdp_cmd("Input.dispatchMouseEvent",
+                               {"type": "mousePressed", "x": x0, "y": y0, "button": "left", "clickCount": 1})
+        driver.execute_cdp_cmd("Input.dispatchMouseEvent",
+                               {"type": "mouseMoved", "x": x0 + x_offset, "y": y0, "button": "left"})
+        driver.execute_cdp_cmd("Input.dispatchMouseEvent",
+                               {"type": "mouseReleased", "x": x0 + x_offset, "y": y0, "button": "left", "clickCount": 1})
+        return True
+    except Exception as e_cdp:
+        logger.warning("      CDP drag failed (%s); falling back to ActionChains.", e_cdp)
+        return False
+
+class ElementCache:
+    """Per-search cache of located elements, keyed by locator tuple.
+
+    The toolbar filter buttons and results item are re-located from scratch
+    for every dialog in the Stops → Price → Times sequence even though they
+    don't move between filters. Cached handles are revalidated with a cheap
+    is_enabled() probe and re-located only when the page has replaced them.
+    Call invalidate() after any navigation.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._cache = {}
+
+    def get(self, locator):
+        """Returns the element for `locator`, reusing a live cached handle."""
+        element = self._cache.get(locator)
+        if element is not None:
+            try:
+                element.is_enabled() # Cheap staleness probe.
+                return element
+            except StaleElementReferenceException:
+                del self._cache[locator]
+        element = self._driver.find_element(*locator)
+        self._cache[locator] = element
+        return element
+
+    def invalidate(self):
+        """Drops every cached handle (the page was replaced)."""
+        self._cache.clear()
+
+def _filter_already_applied(driver, button_locator, applied_text):
+    """True when a filter button's aria-label already reflects the applied
+    state (e.g. "Stops, Nonstop only" vs. plain "Stops").
+
+    With a reused driver the previous search's filters are often still
+    active, and reading one attribute is far cheaper than an open/select/
+    close dialog cycle that ends in the same state.
+    """
+    buttons = driver.find_elements(*button_locator)
+    if not buttons:
+        return False
+    return applied_text in (buttons[0].get_attribute('aria-label') or '')
+
+# Central wait tuning: every explicit wait in this module shares one default
+# timeout and fast (100ms) poll, so adjustments are a one-line change here.
+_WAIT_TIMEOUT_SECONDS = 20
+_WAIT_POLL_SECONDS = 0.1
+
+def _wait_for(driver, locator, cond=EC.presence_of_element_located, timeout=_WAIT_TIMEOUT_SECONDS):
+    """Waits for `cond(locator)` and returns whatever the condition resolves to.
+
+    One explicit, centrally tunable wait for the one-off call sites that
+    previously constructed their own WebDriverWait or relied on fixed sleeps.
+    """
+    return WebDriverWait(driver, timeout, poll_frequency=_WAIT_POLL_SECONDS).until(cond(locator))
+
+# Global opt-in for the long inspection pauses, read once at import. Off by
+# default so production runs can never block on them, even if a pause call
+# gets added (or uncommented) somewhere new.
+DEBUG_PAUSE = int(os.environ.get("TRIP_DEBUG_PAUSE", "0"))
+
+def _wait_for_selector_cdp(driver, css_selector, timeout=_WAIT_TIMEOUT_SECONDS):
+    """Blocks until `css_selector` matches a node, via an in-page MutationObserver.
+
+    One Runtime.evaluate with awaitPromise parks server-side and resolves the
+    instant the node is inserted, where WebDriverWait costs a findElement
+    round trip per poll tick. Returns True once the selector matches, False
+    on timeout or when CDP is unavailable (caller falls back to polling).
+    """
+    expression = (
+        "new Promise((resolve) => {"
+        f"  const sel = {json.dumps(css_selector)};"
+        "  if (document.querySelector(sel)) { resolve(true); return; }"
+        "  const mo = new MutationObserver(() => {"
+        "    if (document.querySelector(sel)) { mo.disconnect(); resolve(true); }"
+        "  });"
+        "  mo.observe(document.body, {subtree: true, childList: true});"
+        f"  setTimeout(() => {{ mo.disconnect(); resolve(false); }}, {int(timeout * 1000)});"
+        "})"
+    )
+    try:
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression, "awaitPromise": True, "returnByValue": True})
+        return bool(result.get("result", {}).get("value"))
+    except Exception as e_cdp:
+        logger.debug("      CDP selector wait unavailable (%s); using polled wait.", e_cdp)
+        return False
+
+def _debug_pause(run_headless, seconds, reason):
+    """Sleeps only when running headed AND TRIP_DEBUG_PAUSE is set in the env.
+
+    The long inspection pauses are handy when watching the browser but must
+    never burn wall-clock time in an automated headless run.
+    """
+    if not run_headless and DEBUG_PAUSE:
+        logger.debug("    [DEBUG_PAUSE] %s (pausing %ss)...", reason, seconds)
+        time.sleep(seconds)
+
+# Returns every static slider property plus the current value in one script
+# call; each individual get_attribute/.size read is a full JSON-over-HTTP
+# round-trip to ChromeDriver.
+_SLIDER_PROPS_JS = (
+    "const i=arguments[0], t=arguments[1];"
+    "const r=t.getBoundingClientRect();"
+    "return {min:+i.min,max:+i.max,step:+i.step,value:+i.value,width:r.width};"
+)
+
+def _set_input(driver, elem, value):
+    """Sets a text input's value in a single JS round-trip.
+
+    Replaces the click / Ctrl+A+DELETE / send_keys sequence per field (five
+    browser RPCs) with one execute_script call. Like the slider helper, it
+    goes through the native value setter and dispatches a bubbling input
+    event so the page's controlled-input handlers fire.
+    """
+    driver.execute_script(
+        "const s=Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype,'value').set;"
+        "s.call(arguments[0], arguments[1]);"
+        "arguments[0].dispatchEvent(new Event('input',{bubbles:true}));",
+        elem, value)
+
+def _set_slider_value_js(driver, wait, slider_input_element, input_locator, target_value):
+    """Sets a slider input to target_value via JavaScript injection.
+
+    One synchronous execute_script call replaces the physical drag, which
+    needs pixel math, a settle wait, and is often off by a step. Returns
+    True once the input reports the target value, False if the page didn't
+    accept the injected value (caller should fall back to dragging).
+    """
+    try:
+        driver.execute_script(_SET_RANGE_VALUE_JS, slider_input_element, str(target_value))
+        wait.until(lambda d: int(d.find_element(*input_locator).get_attribute('value')) == target_value)
+        return True
+    except TimeoutException:
+        return False
+    except Exception as e_js:
+        logger.warning("      JS slider injection error: %s", e_js)
+        return False
+
+def _retry_stale(fn, *args, tries=3, delay=0.2, **kwargs):
+    """Calls fn, retrying on StaleElementReferenceException with backoff.
+
+    Slider updates trigger re-renders that routinely invalidate element
+    handles mid-gesture; without the retry one stale handle aborts the
+    whole filter pass and forces the entire search to be redone.
+    """
+    for attempt in range(tries):
+        try:
+            return fn(*args, **kwargs)
+        except StaleElementReferenceException:
+            if attempt == tries - 1:
+                raise
+            logger.debug("      Stale element handle (attempt %d/%d); retrying in %.1fs...", attempt + 1, tries, delay)
+            time.sleep(delay)
+            delay *= 2
+
+# Arrow-key nudges beat a physical drag only while the press count stays
+# small; past this many presses a single drag is the cheaper gesture.
+_MAX_ARROW_KEY_PRESSES = 24
+
+def _set_slider_by_keys(driver, wait, slider_input_element, input_locator, target_value, presses):
+    """Moves a slider by sending a batched run of arrow keys to its input.
+
+    The slider inputs accept arrow-key adjustments when focused, and the
+    whole run goes out as one send_keys command — no pixel math, no
+    element-rect reads, no drag gesture. Returns True once the input
+    reports the target value, False so the caller can fall back to dragging.
+    """
+    key = Keys.ARROW_RIGHT if presses > 0 else Keys.ARROW_LEFT
+    try:
+        slider_input_element.click() # Focus the input so it receives the keys.
+        slider_input_element.send_keys(key * abs(presses))
+        wait.until(lambda d: int(d.find_element(*input_locator).get_attribute('value')) == target_value)
+        return True
+    except TimeoutException:
+        return False
+    except Exception as e_keys:
+        logger.warning("      Arrow-key slider adjustment error: %s", e_keys)
+        return False
+
 # --- Helper function to set a slider thumb ---
-def _set_slider_thumb_value(driver, wait, thumb_xpath, input_xpath, slider_track_xpath, target_value, slider_label):
-    """Helper function to set a single slider thumb to a target value."""
-    print(f"      Attempting to set {slider_label} to {target_value}...")
+def _set_slider_thumb_value(driver, wait, thumb_locator, input_locator, track_locator, target_value, slider_label, props_cache=None):
+    """Helper function to set a single slider thumb to a target value.
+
+    Locator arguments are (By, selector) tuples, so callers can pass either
+    the module-level constants or dialog-scoped locators.
+
+    props_cache is a caller-owned dict memoizing the static slider
+    properties (input min/max/step, track width) across invocations. The
+    Times dialog sets four thumbs against two tracks, so without the cache
+    the same get_attribute/.size round-trips repeat per thumb; with it,
+    repeat calls only re-read the current value.
+    """
+    logger.debug("      Attempting to set %s to %s...", slider_label, target_value)
+    if props_cache is None:
+        props_cache = {}
     try:
-        # Locate the hidden input to get its properties
-        slider_input_element = wait.until(EC.presence_of_element_located((By.XPATH, input_xpath)))
-        min_val = int(slider_input_element.get_attribute('min'))
-        max_val = int(slider_input_element.get_attribute('max'))
-        step_size = int(slider_input_element.get_attribute('step'))
-        current_value = int(slider_input_element.get_attribute('value'))
-
-        # Locate the visible slider track
-        slider_track = driver.find_element(By.XPATH, slider_track_xpath)
-        slider_track_width = slider_track.size['width']
-        
-        # Locate the draggable thumb element
-        thumb_element = driver.find_element(By.XPATH, thumb_xpath)
+        # Locate the hidden input; its min/max/step (and the track width)
+        # never change, so on a cache miss everything is fetched in one
+        # batched script call and the static parts cached. On a hit, only
+        # the current value is re-read.
+        slider_input_element = wait.until(EC.presence_of_element_located(input_locator))
+        input_props = props_cache.get(input_locator)
+        track_props = props_cache.get(track_locator)
+        if input_props is None or track_props is None:
+            slider_track = driver.find_element(*track_locator)
+            props = driver.execute_script(_SLIDER_PROPS_JS, slider_input_element, slider_track)
+            input_props = {"min": int(props["min"]), "max": int(props["max"]), "step": int(props["step"])}
+            track_props = {"width": props["width"], "track_elem": slider_track}
+            props_cache[input_locator] = input_props
+            props_cache[track_locator] = track_props
+            current_value = int(props["value"])
+        else:
+            current_value = int(slider_input_element.get_attribute('value'))
+        min_val = input_props["min"]
+        max_val = input_props["max"]
+        step_size = input_props["step"]
+        slider_track_width = track_props["width"]
         
-        print(f"        {slider_label} Slider: min={min_val}, max={max_val}, step={step_size}, current_value={current_value}, target_value={target_value}")
-        print(f"        {slider_label} Slider track width: {slider_track_width}px")
+        logger.debug("        %s Slider: min=%s, max=%s, step=%s, current_value=%s, target_value=%s", slider_label, min_val, max_val, step_size, current_value, target_value)
+        logger.debug("        %s Slider track width: %spx", slider_label, slider_track_width)
 
         # Clamp target_value to min/max of the specific thumb
         clamped_target_value = max(min_val, min(max_val, target_value))
@@ -76,71 +550,369 @@ def _set_slider_thumb_value(driver, wait, thumb_xpath, input_xpath, slider_track
         if target_value == current_value:
             return True
 
-        if step_size <= 0: step_size = 1 # Avoid division by zero or non-positive step
-        
-        # Ensure total_steps_in_slider is not zero before division
-        if max_val == min_val: # slider has no range
-             total_steps_in_slider = 0
-        else:
-            total_steps_in_slider = (max_val - min_val) / step_size
-        
-        pixels_per_step = 0
-        if total_steps_in_slider != 0 and slider_track_width > 0 :
-            pixels_per_step = slider_track_width / total_steps_in_slider
+        # Deterministic path first: inject the value directly and let the
+        # page's own event handlers move the thumb.
+        if _set_slider_value_js(driver, wait, slider_input_element, input_locator, target_value):
+            logger.debug("        Set %s to %s via JS injection.", slider_label, target_value)
+            return True
+        logger.warning("        JS injection did not stick for %s; falling back to thumb drag.", slider_label)
+
+        if step_size <= 0: step_size = 1 # Kept sane for the press count and verification below
+
+        # Middle path: a short run of arrow keys on the focused input is one
+        # send_keys command and needs neither pixel math nor rect reads.
+        # Truncate toward zero (plain // floors away from zero for negative
+        # deltas) so a run of presses can undershoot but never overshoot.
+        presses = int((target_value - current_value) / step_size)
+        if presses != 0 and abs(presses) < _MAX_ARROW_KEY_PRESSES:
+            if _set_slider_by_keys(driver, wait, slider_input_element, input_locator, target_value, presses):
+                logger.debug("        Set %s to %s via %s arrow key press(es).", slider_label, target_value, abs(presses))
+                return True
+            logger.warning("        Arrow keys did not stick for %s; falling back to thumb drag.", slider_label)
+            # A partial key run may still have moved the slider; re-read the
+            # value so the drag below starts from where the thumb actually is.
+            current_value = int(driver.find_element(*input_locator).get_attribute('value'))
+            if current_value == target_value:
+                return True
+
+        # The draggable thumb is only needed on this fallback path.
+        thumb_element = driver.find_element(*thumb_locator)
+
+        # Integer arithmetic: offset = delta-value * width // range. One
+        # multiply and one floor divide with deterministic rounding, instead
+        # of the old float divisions plus math.ceil (whose rounding was the
+        # suspected cause of off-by-one-step drags). step_size cancels out
+        # of the ratio entirely. Both factors can be negative, which floor
+        # division handles with the correct sign.
+        if max_val != min_val and slider_track_width > 0:
+            x_drag_offset = (target_value - current_value) * int(slider_track_width) // (max_val - min_val)
         else:
-            print(f"        WARNING: Cannot accurately calculate pixels_per_step for {slider_label} (total_steps: {total_steps_in_slider}, track_width: {slider_track_width}). Drag might be inaccurate.")
-
-        steps_to_move = (target_value - current_value) / step_size
-        x_drag_offset = int(math.ceil(steps_to_move * pixels_per_step)) # Use math.ceil to ensure movement if pixels_per_step is small
+            logger.warning("        WARNING: Cannot calculate drag offset for %s (range: %s-%s, track_width: %s). Skipping drag.", slider_label, min_val, max_val, slider_track_width)
+            x_drag_offset = 0
 
         if x_drag_offset != 0:
-            actions = ActionChains(driver)
-            actions.drag_and_drop_by_offset(thumb_element, x_drag_offset, 0).perform()
-            time.sleep(2.0) # Pause for UI to update after drag
+            if not _cdp_drag(driver, thumb_element, x_drag_offset):
+                actions = ActionChains(driver)
+                actions.drag_and_drop_by_offset(thumb_element, x_drag_offset, 0).perform()
+            # Poll for the input value to settle instead of a fixed pause.
+            try:
+                wait.until(lambda d: int(d.find_element(*input_locator).get_attribute('value')) == target_value)
+            except TimeoutException:
+                pass # Value may be off by a step; the verification below reports it.
         else:
             pass # No action needed if offset is 0
 
         # Verify the value after trying to set by drag
         try:
             # Re-fetch input element to get updated value
-            slider_input_element_after_drag = driver.find_element(By.XPATH, input_xpath) 
+            slider_input_element_after_drag = driver.find_element(*input_locator)
             updated_value_attr = slider_input_element_after_drag.get_attribute('value')
             # Check if the new value is close to the target (within one step, due to rounding/pixel precision)
             if abs(int(updated_value_attr) - target_value) >= step_size and step_size > 0 : # Check if off by at least one full step
-                print(f"        WARNING: {slider_label} value {updated_value_attr} is not close to target {target_value} after drag.")
+                logger.warning("        WARNING: %s value %s is not close to target %s after drag.", slider_label, updated_value_attr, target_value)
         except Exception as e_val_check:
-            print(f"        Could not check {slider_label} value after drag: {e_val_check}")
+            logger.warning("        Could not check %s value after drag: %s", slider_label, e_val_check)
 
         return True
 
+    except StaleElementReferenceException:
+        raise # Let _retry_stale at the call site re-resolve and retry.
     except TimeoutException as e_timeout:
-        print(f"      Timeout while trying to set {slider_label}: {e_timeout}")
+        logger.warning("      Timeout while trying to set %s: %s", slider_label, e_timeout)
         return False
     except Exception as e_general:
-        print(f"      Error setting {slider_label}: {e_general}")
+        logger.warning("      Error setting %s: %s", slider_label, e_general)
         return False
 
+# --- Shared driver for serial searches ---
+# One Chrome process reused across back-to-back searches skips the per-call
+# binary spawn and DevTools handshake (5-10s each). Between searches the
+# caller resets state with delete_all_cookies + about:blank instead of
+# quitting. Parallel callers should use FlightFinderPool below instead.
+_DRIVER_SINGLETON = None
+_DRIVER_SINGLETON_LOCK = threading.Lock()
+
+def _get_or_create_driver(headless=True):
+    """Returns the module-level shared driver, creating it on first use."""
+    global _DRIVER_SINGLETON
+    with _DRIVER_SINGLETON_LOCK:
+        if _DRIVER_SINGLETON is None:
+            _DRIVER_SINGLETON = get_webdriver(headless=headless)
+        return _DRIVER_SINGLETON
+
+def _discard_singleton_driver():
+    """Quits the shared driver (if any) so the next call recreates it."""
+    global _DRIVER_SINGLETON
+    with _DRIVER_SINGLETON_LOCK:
+        driver, _DRIVER_SINGLETON = _DRIVER_SINGLETON, None
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+atexit.register(_discard_singleton_driver)
+
+# --- Driver pool for concurrent searches ---
+class FlightFinderPool:
+    """A small pool of pre-warmed WebDrivers checked in and out of a queue.
+
+    Chrome startup (binary spawn plus DevTools handshake) costs 10-15s per
+    process; keeping up to max_workers drivers alive amortizes that cost
+    across every search in the run. Drivers are created lazily on first
+    checkout and reset cheaply (cookies cleared, about:blank) on check-in
+    instead of being recreated.
+    """
+
+    def __init__(self, max_workers=4, headless=True):
+        self.max_workers = max_workers
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        # Quit whatever is idle when the interpreter exits; checked-out
+        # drivers are the responsibility of their current user.
+        atexit.register(self.shutdown)
+
+    def acquire(self):
+        """Returns an idle driver, creating one if under the cap, else blocks."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.max_workers:
+                self._created += 1
+                driver = get_webdriver(headless=self.headless)
+                if driver is None:
+                    self._created -= 1
+                return driver
+        return self._idle.get() # Pool is full; wait for a check-in.
+
+    def release(self, driver):
+        """Resets the driver's state and returns it to the pool."""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put(driver)
+        except Exception as e_reset:
+            # A driver that can't reset is likely wedged; drop it so a fresh
+            # one can be created on the next acquire.
+            logger.warning("    Discarding wedged pooled driver: %s", e_reset)
+            with self._lock:
+                self._created -= 1
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def shutdown(self):
+        """Quits all idle drivers."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+def find_flights_parallel(travelers, trip_period, destination_airports, run_headless=True, pool=None):
+    """Runs one search per traveler concurrently over a driver pool.
+
+    Args:
+        travelers (list[dict]): traveler_info dicts as taken by find_flights_selenium.
+        trip_period (dict): Contains start_date_str and end_date_str.
+        destination_airports (list): Candidate destination airport codes.
+        run_headless (bool): Used when the pool has to create drivers.
+        pool (FlightFinderPool): Optional shared pool; one is created per call otherwise.
+
+    Returns:
+        list: One result list per traveler, in the same order as `travelers`.
+    """
+    pool = pool or FlightFinderPool(headless=run_headless)
+
+    def _search_one(traveler_info):
+        driver = pool.acquire()
+        if driver is None:
+            return [{"status": "ERROR_WEBDRIVER_INIT", "message": "Failed to initialize pooled WebDriver."}]
+        try:
+            return find_flights_selenium(trip_period, traveler_info, destination_airports,
+                                         run_headless=run_headless, driver=driver)
+        finally:
+            pool.release(driver)
+
+    with ThreadPoolExecutor(max_workers=pool.max_workers) as executor:
+        return list(executor.map(_search_one, travelers))
+
+class FlightSearchSession:
+    """Context manager owning one WebDriver reused across several searches.
+
+    For callers that iterate traveler/destination combinations serially this
+    keeps the Chrome launch cost to one per session: between searches the
+    driver is reset (cookies cleared, about:blank) instead of relaunched,
+    and exiting the block quits it.
+    """
+
+    def __init__(self, run_headless=True):
+        self.run_headless = run_headless
+        self._driver = None
+
+    def __enter__(self):
+        self._driver = get_webdriver(headless=self.run_headless)
+        return self
+
+    def search(self, trip_period, traveler_info, destination_airports):
+        """Runs one search on the session driver; same return shape as
+        find_flights_selenium. If the driver fails to launch, the search
+        falls back to a one-shot driver of its own."""
+        results = find_flights_selenium(trip_period, traveler_info, destination_airports,
+                                        run_headless=self.run_headless, driver=self._driver)
+        if self._driver is not None:
+            try:
+                self._driver.delete_all_cookies()
+                self._driver.get("about:blank")
+            except Exception as e_reset:
+                # A driver that can't reset is likely wedged; replace it so
+                # the next search starts clean.
+                logger.warning("    Session driver failed to reset, relaunching: %s", e_reset)
+                try:
+                    self._driver.quit()
+                except Exception:
+                    pass
+                self._driver = get_webdriver(headless=self.run_headless)
+        return results
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            finally:
+                self._driver = None
+        return False
+
+# --- Interactive form entry (fallback when the deep link doesn't resolve) ---
+def _fill_search_form(driver, wait, origin_ap, dest_ap, trip_period):
+    """Fills the Google Flights search form interactively and clicks Search.
+
+    Only used when the deep-link URL fails to land on results; the happy
+    path skips this entirely.
+    """
+    # --- Locate and fill origin ---
+    logger.debug("    Locating origin input...")
+    origin_input_field = wait.until(EC.presence_of_element_located(ORIGIN_INPUT))
+
+    # One JS assignment replaces the click/clear/type round-trips.
+    _set_input(driver, origin_input_field, origin_ap)
+    logger.debug("    Set origin: %s", origin_ap)
+
+    # Updated suggestion selection logic
+    # Wait for the listbox itself to appear first; this replaces the old
+    # fixed pause for suggestions to populate.
+    # The combobox flips aria-expanded to "true" the moment its suggestion
+    # request resolves — earlier and more reliable than waiting on the
+    # listbox element itself.
+    wait.until(lambda d: origin_input_field.get_attribute("aria-expanded") == "true")
+    logger.debug("    Origin suggestions expanded.")
+
+    # Now find the specific suggestion by its data-code; data-type='1'
+    # restricts to airport entries (vs. city entries).
+    origin_suggestion = suggestion_locator(origin_ap, airport_only=True)
+    logger.debug("    Trying to click suggestion with locator: %s", origin_suggestion[1])
+    suggestion_to_click = wait.until(EC.element_to_be_clickable(origin_suggestion))
+    suggestion_to_click.click()
+    logger.debug("    Clicked origin suggestion for %s", origin_ap)
+
+    # --- Locate and fill destination ---
+    logger.debug("    Locating destination input ('Where to? ')...")
+    # Target the input field that seems to be reactivated for destination input.
+    # Using the aria-label with a trailing space as observed in user-provided HTML.
+    # The clickability wait below also covers the autofocus settling that
+    # used to be a fixed pause.
+    dest_input_field = wait.until(EC.element_to_be_clickable(DEST_INPUT))
+
+    _set_input(driver, dest_input_field, dest_ap)
+    logger.debug("    Set destination: %s", dest_ap)
+
+    # Reuse suggestion logic for destination
+    # Wait for the listbox itself to appear first (it might be the same listbox as origin or a new one)
+    # Same aria-expanded readiness signal as for the origin field.
+    wait.until(lambda d: dest_input_field.get_attribute("aria-expanded") == "true")
+    logger.debug("    Destination suggestions expanded.")
+
+    # Simplified locator for the destination, relying on data-code only.
+    dest_suggestion = suggestion_locator(dest_ap)
+    logger.debug("    Trying to click destination suggestion with locator: %s", dest_suggestion[1])
+    suggestion_to_click_dest = wait.until(EC.element_to_be_clickable(dest_suggestion))
+    suggestion_to_click_dest.click()
+    logger.debug("    Clicked destination suggestion for %s", dest_ap)
+
+    # --- Enter Dates (This is often the trickiest part) ---
+    logger.debug("    Locating date inputs...")
+    try:
+        departure_date_field = wait.until(EC.element_to_be_clickable(DEPARTURE_DATE_INPUT))
+        logger.debug("    Found departure date field. Setting value: %s", trip_period['start_date_str'])
+        _set_input(driver, departure_date_field, trip_period['start_date_str'])
+        logger.debug("    Set departure date. Attempting to close calendar with ENTER key.")
+        departure_date_field.send_keys(Keys.ENTER)
+
+        # The presence wait replaces the fixed pause for the calendar to close.
+        return_date_field = wait.until(EC.presence_of_element_located(RETURN_DATE_INPUT))
+        logger.debug("    Found return date field. Setting value: %s", trip_period['end_date_str'])
+        _set_input(driver, return_date_field, trip_period['end_date_str'])
+        logger.debug("    Set return date. Attempting to close calendar with ENTER key.")
+        return_date_field.send_keys(Keys.ENTER) # Also try to close calendar for return date
+
+        # Click "Done" button for dates
+        logger.debug("    Attempting to click 'Done' button for dates...")
+        date_done_button = wait.until(EC.element_to_be_clickable(DATES_DONE_BTN))
+        date_done_button.click()
+        logger.debug("    Clicked 'Done' for dates.")
+
+    except TimeoutException as e_date:
+        logger.warning("    Timeout while trying to input dates or click Done: %s", e_date)
+        logger.warning("    Could not find or interact with date fields or Done button as expected.")
+    except Exception as e_date_general:
+        logger.warning("    An error occurred during date input: %s", e_date_general)
+
+    # --- Click Search/Done button ---
+    logger.debug("    Looking for final 'Search' button (for flight listings)...")
+    try:
+        search_button = wait.until(EC.element_to_be_clickable(SEARCH_BTN)) # Specific locator for the correct Search button
+        search_button.click()
+        logger.debug("    Clicked main 'Search' button.")
+    except TimeoutException:
+        logger.warning("    Could not find or click the specific 'Search' button for flight listings.")
+        # If this fails, it's a critical error for this flow.
+        raise # Re-raise the exception to stop the script if search button isn't found/clicked
+
 # --- Main flight finding function using Selenium ---
-def find_flights_selenium(trip_period, traveler_info, destination_airports, run_headless=True):
+def find_flights_selenium(trip_period, traveler_info, destination_airports, run_headless=True, driver=None):
     """Finds flights using Selenium to automate Google Flights.
     Initial version focuses on performing the search and reaching results page.
+
+    When `driver` is supplied (e.g. checked out of a FlightFinderPool), it is
+    reused and left open for the caller; otherwise one is created and quit here.
     """
-    print(f"  [FlightFinder Selenium] Starting search for {traveler_info['name']}")
-    print(f"                 Dates: {trip_period['start_date_str']} to {trip_period['end_date_str']}")
+    logger.info("  [FlightFinder Selenium] Starting search for %s", traveler_info['name'])
+    logger.debug("                 Dates: %s to %s", trip_period['start_date_str'], trip_period['end_date_str'])
     traveler_budget = traveler_info.get('budget') # Get budget, default to None if not present
     if traveler_budget:
-        print(f"                 Budget: ${traveler_budget}")
+        logger.debug("                 Budget: $%s", traveler_budget)
     
     origin_ap = traveler_info['origin_airport_options'][0] if traveler_info['origin_airport_options'] else None
     dest_ap = destination_airports[0] if destination_airports else None
 
     if not origin_ap or not dest_ap:
-        print("    -> Missing origin or destination airport for search.")
+        logger.warning("    -> Missing origin or destination airport for search.")
         return [{ "status": "ERROR_MISSING_INPUTS", "message": "Origin or destination airport missing."}]
 
-    print(f"                 From {origin_ap} to {dest_ap}")
+    logger.debug("                 From %s to %s", origin_ap, dest_ap)
 
-    driver = get_webdriver(headless=run_headless)
+    owns_driver = driver is None
+    if owns_driver:
+        driver = get_webdriver(headless=run_headless)
     if not driver:
         return [{ "status": "ERROR_WEBDRIVER_INIT", "message": "Failed to initialize WebDriver."}]
 
@@ -149,419 +921,325 @@ def find_flights_selenium(trip_period, traveler_info, destination_airports, run_
     flight_results_summary = []
 
     try:
-        driver.get(GOOGLE_FLIGHTS_URL)
-        print(f"    Navigated to {GOOGLE_FLIGHTS_URL}")
-        wait = WebDriverWait(driver, 20) # Increased wait time
+        deeplink_url = _build_deeplink_url(origin_ap, dest_ap, trip_period['start_date_str'], trip_period['end_date_str'])
+        driver.get(deeplink_url)
+        logger.debug("    Navigated to %s", deeplink_url)
+        # Fast polling (100ms) so waits return as soon as the UI is ready,
+        # rather than the default 500ms granularity.
+        wait = WebDriverWait(driver, _WAIT_TIMEOUT_SECONDS, poll_frequency=_WAIT_POLL_SECONDS)
+        # Located-element cache for handles reused across the filter sequence.
+        elements = ElementCache(driver)
 
         # --- Consent form / "Before you continue" dialog (if it appears) ---
         try:
             # Google sometimes shows a consent form. Common button text is "Accept all" or "Reject all"
-            # Using a more general XPath that looks for buttons with specific text patterns.
-            consent_button_xpath = "//button[.//span[contains(text(),'Accept all') or contains(text(),'Reject all') or contains(text(),'I agree')]]"
-            consent_button = wait.until(EC.element_to_be_clickable((By.XPATH, consent_button_xpath)))
-            print("    Consent form detected. Clicking a consent button (e.g., 'Reject all' or 'Accept all')...")
+            # Using a more general locator that looks for buttons with specific text patterns.
+            consent_button = wait.until(EC.element_to_be_clickable(CONSENT_BTN))
+            logger.debug("    Consent form detected. Clicking a consent button (e.g., 'Reject all' or 'Accept all')...")
             # To be less intrusive / faster, often "Reject all" is preferred if available and functional.
-            # Prioritize "Reject all" then "Accept all"
-            try:
-                reject_all_button_xpath = "//button[.//span[contains(text(),'Reject all')]]"
-                reject_button = driver.find_element(By.XPATH, reject_all_button_xpath)
-                reject_button.click()
-                print("    Clicked 'Reject all'.")
-            except NoSuchElementException:
-                print("    'Reject all' not found, trying 'Accept all' or similar.")
+            # Prioritize "Reject all" then "Accept all". find_elements returns
+            # [] immediately rather than waiting out an exception, so probing
+            # for the optional button costs nothing.
+            rejects = driver.find_elements(*REJECT_ALL_BTN)
+            if rejects:
+                rejects[0].click()
+                logger.debug("    Clicked 'Reject all'.")
+            else:
+                logger.warning("    'Reject all' not found, trying 'Accept all' or similar.")
                 consent_button.click() # Fallback to the first found button
-                print("    Clicked a consent button.")
-            print("    Consent form handled.")
-            time.sleep(2) # Wait for dialog to disappear
+                logger.debug("    Clicked a consent button.")
+            logger.debug("    Consent form handled.")
+            # Wait for the dialog to actually disappear instead of a fixed pause.
+            wait.until(EC.invisibility_of_element_located(CONSENT_BTN))
         except TimeoutException:
-            print("    No consent form detected or already handled.")
+            logger.debug("    No consent form detected or already handled.")
         except Exception as e_consent:
-            print(f"    Error handling consent form: {e_consent}")
+            logger.warning("    Error handling consent form: %s", e_consent)
 
-        # --- Locate and fill origin --- 
-        print("    Locating origin input...")
-        origin_input_xpath = "//input[@aria-label='Where from?']"
-        origin_input_field = wait.until(EC.presence_of_element_located((By.XPATH, origin_input_xpath)))
-        
-        # Click to ensure it's focused, then clear and send keys
-        # Some inputs on Google Flights are divs that swap to inputs, direct interaction is key
-        origin_input_field.click() 
-        time.sleep(0.3) # Brief pause for any JS focusing or swapping
-        origin_input_field.send_keys(Keys.CONTROL + "a" + Keys.DELETE) # Clear field
-        time.sleep(0.2)
-        origin_input_field.send_keys(origin_ap)
-        print(f"    Typed origin: {origin_ap}")
-        time.sleep(0.5) # Adjust this timing if needed for suggestions to populate
-        
-        # Updated suggestion selection logic
-        # Wait for the listbox itself to appear first
-        listbox_xpath = "//ul[@role='listbox']"
-        wait.until(EC.presence_of_element_located((By.XPATH, listbox_xpath)))
-        print("    Suggestion listbox appeared.")
-        
-        # Now find the specific suggestion. This XPath tries to find an item that contains the airport code 
-        # and is often followed by the city or airport name. Adjust if necessary.
-        # It looks for a list item that has a div containing a span with the airport code.
-        # Or a div directly containing the airport code and the word airport in its text or a child span.
-        specific_suggestion_xpath = f"//li[@role='option' and @data-code='{origin_ap}' and @data-type='1']"
-        # Fallback if the above is too complex or specific (e.g., if 'airport' text isn't always present):
-        # specific_suggestion_xpath = f"//ul[@role='listbox']/li[@role='option'][.//div[contains(., '{origin_ap}')]][1]"
-        print(f"    Trying to click suggestion with XPath: {specific_suggestion_xpath}")
-        suggestion_to_click = wait.until(EC.element_to_be_clickable((By.XPATH, specific_suggestion_xpath)))
-        suggestion_to_click.click()
-        print(f"    Clicked origin suggestion for {origin_ap}")
-        time.sleep(0.5) # Short pause for origin dropdown/UI to settle
-
-        # --- Locate and fill destination ---
-        print("    Locating destination input ('Where to? ')...")
-        # Target the input field that seems to be reactivated for destination input.
-        # Using the aria-label with a trailing space as observed in user-provided HTML.
-        dest_input_xpath = "//input[@aria-label='Where to? ']" 
-        dest_input_field = wait.until(EC.element_to_be_clickable((By.XPATH, dest_input_xpath)))
-        
-        # dest_input_field.click() # Removed click as field might be autofocused
-        time.sleep(0.5) # Increased pause to allow autofocus to settle before sending keys
-        dest_input_field.send_keys(Keys.CONTROL + "a" + Keys.DELETE)
-        time.sleep(0.2)
-        dest_input_field.send_keys(dest_ap)
-        print(f"    Typed destination: {dest_ap}")
-        time.sleep(0.5) # Adjust this timing if needed for suggestions to populate
-        
-        # Reuse suggestion logic for destination
-        # Wait for the listbox itself to appear first (it might be the same listbox as origin or a new one)
-        listbox_xpath = "//ul[@role='listbox']" # Assuming same listbox XPath, adjust if different for dest
-        wait.until(EC.presence_of_element_located((By.XPATH, listbox_xpath)))
-        print("    Destination suggestion listbox appeared.")
-        
-        specific_suggestion_xpath_dest = f"//li[@role='option' and @data-code='{dest_ap}']" # Simplified XPath, relying on data-code
-        print(f"    Trying to click destination suggestion with XPath: {specific_suggestion_xpath_dest}")
-        suggestion_to_click_dest = wait.until(EC.element_to_be_clickable((By.XPATH, specific_suggestion_xpath_dest)))
-        suggestion_to_click_dest.click()
-        print(f"    Clicked destination suggestion for {dest_ap}")
-
-        # --- Enter Dates (This is often the trickiest part) ---
-        print("    Locating date inputs...")
+        # --- Fast path: the deep link should land directly on results ---
+        logger.debug("    Waiting for flight results from deep link...")
         try:
-            departure_date_xpath = "//input[@aria-label='Departure' and @placeholder='Departure']"
-            departure_date_field = wait.until(EC.element_to_be_clickable((By.XPATH, departure_date_xpath)))
-            print(f"    Found departure date field. Clicking and sending keys: {trip_period['start_date_str']}")
-            departure_date_field.click()
-            time.sleep(0.3) # Brief pause for calendar to open or field to be fully active
-            departure_date_field.send_keys(Keys.CONTROL + "a" + Keys.DELETE) # Clear field first
-            time.sleep(0.2)
-            departure_date_field.send_keys(trip_period['start_date_str'])
-            time.sleep(0.3) # Pause after sending keys
-            print("    Sent departure date. Attempting to close calendar with ENTER key.")
-            departure_date_field.send_keys(Keys.ENTER)
-            time.sleep(0.5) # Wait for calendar to close
-
-            return_date_xpath = "//input[@aria-label='Return' and @placeholder='Return']"
-            return_date_field = wait.until(EC.presence_of_element_located((By.XPATH, return_date_xpath))) # Wait for presence, not clickability initially
-            print(f"    Found return date field. Sending keys: {trip_period['end_date_str']}")
-            # return_date_field.click() # Removed click, assuming field is auto-focused or ready
-            time.sleep(0.3) # Brief pause before sending keys
-            return_date_field.send_keys(Keys.CONTROL + "a" + Keys.DELETE) # Clear field
-            time.sleep(0.2)
-            return_date_field.send_keys(trip_period['end_date_str'])
-            time.sleep(0.3)
-            print("    Sent return date. Attempting to close calendar with ENTER key.")
-            return_date_field.send_keys(Keys.ENTER) # Also try to close calendar for return date
-            time.sleep(0.5) # Wait for calendar to close
-
-            # Click "Done" button for dates
-            done_button_xpath = "//button[@aria-label='Done. ']"
-            print("    Attempting to click 'Done' button for dates...")
-            date_done_button = wait.until(EC.element_to_be_clickable((By.XPATH, done_button_xpath)))
-            date_done_button.click()
-            print("    Clicked 'Done' for dates.")
-
-            # print("DEBUG: Pausing for 60s AFTER date 'Done' button. Check if results load or what search button to click.") # Remove this pause
-            # time.sleep(60)
-
-        except TimeoutException as e_date:
-            print(f"    Timeout while trying to input dates or click Done: {e_date}")
-            print("    Could not find or interact with date fields or Done button as expected.")
-        except Exception as e_date_general:
-            print(f"    An error occurred during date input: {e_date_general}")
-
-        # --- Click Search/Done button --- # Re-enabling with specific XPath
-        print("    Looking for final 'Search' button (for flight listings)...")
-        try:
-            search_button_xpath = "//button[@aria-label='Search' and @jsname='vLv7Lb']" # Specific XPath for the correct Search button
-            search_button = wait.until(EC.element_to_be_clickable((By.XPATH, search_button_xpath)))
-            search_button.click()
-            print("    Clicked main 'Search' button.")
-
-            # print("DEBUG: Pausing for 60s AFTER main 'Search' button click. Inspect results page for indicator XPath.") # Removing debug pause
-            # time.sleep(60) # PAUSE FOR DEBUGGING RESULTS PAGE INDICATOR
-
+            WebDriverWait(driver, 10, poll_frequency=_WAIT_POLL_SECONDS).until(lambda d: elements.get(RESULTS_ITEM))
+            logger.info("    Deep link loaded flight results directly; skipped form entry.")
         except TimeoutException:
-            print("    Could not find or click the specific 'Search' button for flight listings.")
-            # If this fails, it's a critical error for this flow.
-            raise # Re-raise the exception to stop the script if search button isn't found/clicked
-
-        # --- Wait for results to load (very basic check for now) --- # Re-enabling
-        print("    Waiting for flight results to appear (indicative check)...")
-        results_indicator_xpath = "//div[@class='JMc5Xc']" # Updated XPath to look for a flight item
-        wait.until(EC.presence_of_element_located((By.XPATH, results_indicator_xpath)))
-        print("    Flight results page seems to have loaded (found a flight item).")
+            # Deep link didn't resolve to results (query parsing can be
+            # finicky); fall back to the interactive form-entry flow.
+            logger.debug("    Deep link did not reach results within 10s; falling back to form entry.")
+            driver.get(GOOGLE_FLIGHTS_URL)
+            elements.invalidate() # New document; cached handles are stale.
+            _fill_search_form(driver, wait, origin_ap, dest_ap, trip_period)
+
+            # --- Wait for results to load (very basic check for now) ---
+            logger.debug("    Waiting for flight results to appear (indicative check)...")
+            wait.until(lambda d: elements.get(RESULTS_ITEM)) # Looks for a flight item
+        logger.info("    Flight results page seems to have loaded (found a flight item).")
         
         # --- VALIDATION STEP 1: After initial search, before filters ---
-        if not run_headless:
-            print("    [VALIDATION 1] Initial search results loaded. Pausing for 30s to verify (before filters)...")
-            time.sleep(30)
+        _debug_pause(run_headless, 30, "[VALIDATION 1] Initial search results loaded; verify before filters")
         
         # --- Apply Filters: Stops ---
-        print("    Attempting to apply 'Stops: Nonstop' filter...")
+        logger.debug("    Attempting to apply 'Stops: Nonstop' filter...")
         try:
-            # Using a more robust XPath that checks for child span text and aria-label prefix
-            stops_filter_button_xpath = "//button[.//span[text()='Stops'] and starts-with(@aria-label, 'Stops')]"
-            print(f"      Locating 'Stops' filter button with XPath: {stops_filter_button_xpath}")
-            stops_button = wait.until(EC.element_to_be_clickable((By.XPATH, stops_filter_button_xpath)))
-            stops_button.click()
-            print("      Clicked 'Stops' filter button.")
-            time.sleep(1) # Brief pause for the dropdown to open
-
-            # Refined XPath to click the surrounding div of the radio button, which is often the actual clickable element.
-            nonstop_option_xpath = "//div[contains(@class, 'VfPpkd-GCYh9b') and .//input[@aria-label='Nonstop only' and @type='radio']]"
-            print(f"      Locating 'Nonstop only' option with XPath: {nonstop_option_xpath}")
-            nonstop_clickable_element = wait.until(EC.element_to_be_clickable((By.XPATH, nonstop_option_xpath)))
-            
-            # Check if the radio button within this element is already selected
-            # To do this, we find the input element relative to the clickable div
-            nonstop_radio_button = nonstop_clickable_element.find_element(By.XPATH, ".//input[@aria-label='Nonstop only']")
-
-            if not nonstop_radio_button.is_selected():
-                nonstop_clickable_element.click()
-                print("      Selected 'Nonstop only'.")
+            # When the button label already reads "Stops, Nonstop only" the
+            # filter is active from a previous search on this driver; skip
+            # the whole open/select/close cycle.
+            if _filter_already_applied(driver, STOPS_BTN, "Nonstop"):
+                logger.info("    'Nonstop only' already applied; skipping Stops dialog.")
             else:
-                print("      'Nonstop only' was already selected.")
+                logger.debug("      Locating 'Stops' filter button with locator: %s", STOPS_BTN[1])
+                stops_button = wait.until(lambda d: elements.get(STOPS_BTN))
+                stops_button.click()
+                logger.debug("      Clicked 'Stops' filter button.")
+                # The clickability wait on the Nonstop option below covers the
+                # dropdown-open delay; no fixed pause needed.
+
+                # NONSTOP_OPTION targets the surrounding div of the radio button, which is often the actual clickable element.
+                logger.debug("      Locating 'Nonstop only' option with locator: %s", NONSTOP_OPTION[1])
+                nonstop_clickable_element = wait.until(EC.element_to_be_clickable(NONSTOP_OPTION))
+
+                # Check if the radio button within this element is already selected
+                # To do this, we find the input element relative to the clickable div
+                nonstop_radio_button = nonstop_clickable_element.find_element(*NONSTOP_RADIO)
+
+                if not nonstop_radio_button.is_selected():
+                    nonstop_clickable_element.click()
+                    logger.debug("      Selected 'Nonstop only'.")
+                else:
+                    logger.debug("      'Nonstop only' was already selected.")
             
-            print("      Waiting for Nonstop filter to apply and UI to refresh...")
-            time.sleep(3) # Increased pause significantly after selection for UI to potentially reload/settle
-
-            # Attempt to close the Stops filter dialog by sending the ESCAPE key
-            print("      Attempting to close 'Stops' dialog by sending ESCAPE key...")
-            try:
-                # Find the body element to send keys to, or any major stable element
-                body_element = driver.find_element(By.XPATH, "//body")
-                body_element.send_keys(Keys.ESCAPE)
-                print("      Sent ESCAPE key to close 'Stops' dialog.")
-            except Exception as e_escape:
-                print(f"      Error sending ESCAPE key: {e_escape}")
-                # If escape fails, we might be stuck, but will proceed to next pause for now
+                logger.debug("      Waiting for Nonstop filter to apply and UI to refresh...")
+                # Wait for the radio button to actually report selected rather
+                # than pausing a fixed 3 seconds for the refresh.
+                try:
+                    wait.until(lambda d: d.find_element(*NONSTOP_OPTION)
+                               .find_element(*NONSTOP_RADIO).is_selected())
+                except TimeoutException:
+                    logger.warning("      WARNING: 'Nonstop only' did not report selected; continuing.")
 
-            print("    Successfully applied 'Stops: Nonstop' filter and closed dialog.")
+                # Attempt to close the Stops filter dialog by sending the ESCAPE key
+                logger.debug("      Attempting to close 'Stops' dialog by sending ESCAPE key...")
+                try:
+                    # One actions RPC, no element fetch and no dependence on
+                    # where focus happens to be.
+                    ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+                    logger.debug("      Sent ESCAPE key to close 'Stops' dialog.")
+                    # Confirm the dropdown actually closed.
+                    wait.until(EC.invisibility_of_element_located(NONSTOP_OPTION))
+                except Exception as e_escape:
+                    logger.warning("      Error sending ESCAPE key: %s", e_escape)
+                    # If escape fails, we might be stuck, but will proceed for now
+
+                logger.info("    Successfully applied 'Stops: Nonstop' filter and closed dialog.")
 
             # --- Apply Filters: Price ---
-            print("    Attempting to open 'Price' filter...")
-            try:
-                price_filter_button_xpath = "//button[.//span[text()='Price'] and starts-with(@aria-label, 'Price')]"
-                print(f"      Locating 'Price' filter button with XPath: {price_filter_button_xpath}")
-                price_button = wait.until(EC.element_to_be_clickable((By.XPATH, price_filter_button_xpath)))
-                price_button.click()
-                print("      Clicked 'Price' filter button.")
-                # Status update for the next step/pause
-                search_success_status = "INFO_PRICE_FILTER_OPENED_PAUSED_FOR_INPUT_INSPECTION"
-                search_message = "Opened Price filter. Paused for Price input elements inspection."
-            except TimeoutException as e_filter_price_open:
-                print(f"    Timeout while trying to open 'Price' filter: {e_filter_price_open}")
-                search_success_status = "ERROR_FILTER_PRICE_OPEN_TIMEOUT"
-                search_message = f"Timeout opening 'Price' filter: {e_filter_price_open}"
-            except Exception as e_filter_price_open_general:
-                print(f"    Error opening 'Price' filter: {e_filter_price_open_general}")
-                search_success_status = "ERROR_FILTER_PRICE_OPEN_GENERAL"
-                search_message = f"General error opening 'Price' filter: {e_filter_price_open_general}"
-
-            # --- Set Price Value ---
-            if traveler_budget is not None:
-                print(f"    Attempting to set price filter to max ${traveler_budget} by dragging slider thumb...")
+            # Skip the whole open/set/close dialog cycle when there is no
+            # budget to apply; previously the dialog was opened just to
+            # discover that and then needed an ESC to close.
+            if traveler_budget is None:
+                logger.debug("    No budget specified for traveler, skipping Price filter entirely.")
+                search_success_status = "INFO_PRICE_FILTER_SKIPPED_PAUSED_FOR_TIMES_INSPECTION"
+                search_message = "Price filter skipped (no budget). Paused for Times filter inspection."
+            elif _filter_already_applied(driver, PRICE_BTN, f"up to ${traveler_budget}"):
+                # Reused driver still has this exact budget applied.
+                logger.info("    Price filter already at max $%s; skipping Price dialog.", traveler_budget)
+                search_success_status = "INFO_PRICE_FILTER_APPLIED_PAUSED_FOR_TIMES_INSPECTION"
+                search_message = f"Price filter already applied (max ${traveler_budget})."
+            else:
+                logger.debug("    Attempting to open 'Price' filter...")
                 try:
-                    # Locate the hidden input to get its properties (min, max, step, current value)
-                    price_input_xpath = "//input[@type='range' and @aria-label='Maximum price']"
-                    price_input = wait.until(EC.presence_of_element_located((By.XPATH, price_input_xpath)))
-                    min_price = int(price_input.get_attribute('min'))
-                    max_price = int(price_input.get_attribute('max'))
-                    step_size = int(price_input.get_attribute('step'))
-                    current_value = int(price_input.get_attribute('value'))
-
-                    # Locate the visible slider track to get its width for pixel calculations
-                    slider_track_xpath = "//div[contains(@class, 'VfPpkd-SxecR') and @jscontroller='tbQzUe' and @jsname='SxecR']"
-                    slider_track = driver.find_element(By.XPATH, slider_track_xpath)
-                    slider_track_width = slider_track.size['width']
-
-                    # Locate the draggable thumb element
-                    thumb_xpath = "//div[@jsname='PFprWc' and .//input[@aria-label='Maximum price']]"
-                    thumb_element = driver.find_element(By.XPATH, thumb_xpath)
-                    
-                    print(f"      Slider details: min=${min_price}, max=${max_price}, step=${step_size}, current_value=${current_value}, target_budget=${traveler_budget}")
-                    print(f"      Slider track width: {slider_track_width}px")
+                    logger.debug("      Locating 'Price' filter button with locator: %s", PRICE_BTN[1])
+                    price_button = wait.until(lambda d: elements.get(PRICE_BTN))
+                    price_button.click()
+                    logger.debug("      Clicked 'Price' filter button.")
+                    # Status update for the next step/pause
+                    search_success_status = "INFO_PRICE_FILTER_OPENED_PAUSED_FOR_INPUT_INSPECTION"
+                    search_message = "Opened Price filter. Paused for Price input elements inspection."
+                except TimeoutException as e_filter_price_open:
+                    logger.warning("    Timeout while trying to open 'Price' filter: %s", e_filter_price_open)
+                    search_success_status = "ERROR_FILTER_PRICE_OPEN_TIMEOUT"
+                    search_message = f"Timeout opening 'Price' filter: {e_filter_price_open}"
+                except Exception as e_filter_price_open_general:
+                    logger.warning("    Error opening 'Price' filter: %s", e_filter_price_open_general)
+                    search_success_status = "ERROR_FILTER_PRICE_OPEN_GENERAL"
+                    search_message = f"General error opening 'Price' filter: {e_filter_price_open_general}"
+
+                # --- Set Price Value ---
+                logger.debug("    Attempting to set price filter to max $%s...", traveler_budget)
+                try:
+                    # One batched script call fetches the input's properties
+                    # and the track width together instead of a round-trip
+                    # per attribute.
+                    price_input = wait.until(EC.presence_of_element_located(PRICE_INPUT))
+                    slider_track = driver.find_element(*PRICE_TRACK)
+                    props = driver.execute_script(_SLIDER_PROPS_JS, price_input, slider_track)
+                    min_price = int(props["min"])
+                    max_price = int(props["max"])
+                    step_size = int(props["step"])
+                    current_value = int(props["value"])
+                    slider_track_width = props["width"]
+
+                    logger.debug("      Slider details: min=$%s, max=$%s, step=$%s, current_value=$%s, target_budget=$%s", min_price, max_price, step_size, current_value, traveler_budget)
+                    logger.debug("      Slider track width: %spx", slider_track_width)
 
                     target_value_for_slider = max(min_price, min(max_price, traveler_budget)) # Clamp budget to min/max
 
                     if target_value_for_slider == current_value:
-                        print(f"      Target price ${target_value_for_slider} is already set. Skipping slider drag.")
+                        logger.debug("      Target price $%s is already set. Skipping slider update.", target_value_for_slider)
+                    elif _set_slider_value_js(driver, wait, price_input, PRICE_INPUT, target_value_for_slider):
+                        # Deterministic path: one synchronous script instead of
+                        # pixel math plus a physical drag.
+                        logger.debug("      Set max price to $%s via JS injection.", target_value_for_slider)
                     else:
-                        if step_size == 0: step_size = 1 # Avoid division by zero if step is 0 (should not happen for range input)
-                        total_steps_in_slider = (max_price - min_price) / step_size
-                        if total_steps_in_slider == 0: # Avoid division by zero if min=max
-                             pixels_per_step = 0
+                        logger.warning("      JS injection did not stick; falling back to thumb drag.")
+                        # The draggable thumb is only needed on this fallback path.
+                        thumb_element = driver.find_element(*PRICE_THUMB)
+                        if step_size == 0: step_size = 1 # Kept sane for the verification check below
+                        # Same integer offset arithmetic as _set_slider_thumb_value.
+                        if max_price != min_price and slider_track_width > 0:
+                            x_drag_offset = (target_value_for_slider - current_value) * int(slider_track_width) // (max_price - min_price)
                         else:
-                            pixels_per_step = slider_track_width / total_steps_in_slider
-                        
-                        steps_to_move = (target_value_for_slider - current_value) / step_size
-                        x_drag_offset = int(steps_to_move * pixels_per_step)
+                            x_drag_offset = 0
 
-                        print(f"      Target value for slider: ${target_value_for_slider}")
-                        print(f"      Pixels per step: {pixels_per_step:.2f}, Steps to move: {steps_to_move}, Calculated X drag offset: {x_drag_offset}px")
+                        logger.debug("      Target value for slider: $%s", target_value_for_slider)
+                        logger.debug("      Calculated X drag offset: %spx", x_drag_offset)
 
                         if x_drag_offset != 0:
-                            actions = ActionChains(driver)
-                            actions.drag_and_drop_by_offset(thumb_element, x_drag_offset, 0).perform()
-                            time.sleep(2.0) # Adjusted pause for UI to update after drag
+                            if not _cdp_drag(driver, thumb_element, x_drag_offset):
+                                actions = ActionChains(driver)
+                                actions.drag_and_drop_by_offset(thumb_element, x_drag_offset, 0).perform()
+                            # Poll for the slider value to settle instead of a fixed pause.
+                            try:
+                                wait.until(lambda d: int(d.find_element(*PRICE_INPUT).get_attribute('value')) == target_value_for_slider)
+                            except TimeoutException:
+                                pass # Value may be off by a step; verification below reports it.
                         else:
-                            print("      Calculated drag offset is 0, no drag action performed.")
+                            logger.debug("      Calculated drag offset is 0, no drag action performed.")
 
                     # Verify the aria-valuetext after trying to set by drag
                     try:
-                        price_input_after_drag = driver.find_element(By.XPATH, price_input_xpath) # Re-fetch
+                        price_input_after_drag = driver.find_element(*PRICE_INPUT) # Re-fetch
                         updated_aria_value = price_input_after_drag.get_attribute('aria-valuetext')
                         current_slider_val_attr = price_input_after_drag.get_attribute('value')
-                        print(f"      Slider aria-valuetext after drag: {updated_aria_value}, value attribute: {current_slider_val_attr}")
+                        logger.debug("      Slider aria-valuetext after drag: %s, value attribute: %s", updated_aria_value, current_slider_val_attr)
                         # Check if the new value is close to the target (within one step, due to rounding/pixel precision)
                         if abs(int(current_slider_val_attr) - target_value_for_slider) > step_size:
-                            print(f"      WARNING: Slider value ${current_slider_val_attr} is not close to target ${target_value_for_slider} after drag.")
+                            logger.warning("      WARNING: Slider value $%s is not close to target $%s after drag.", current_slider_val_attr, target_value_for_slider)
                     except Exception as e_aria_check:
-                        print(f"      Could not check slider values after drag: {e_aria_check}")
+                        logger.warning("      Could not check slider values after drag: %s", e_aria_check)
 
                     # Close Price dialog using ESCAPE key
-                    print("      Attempting to close 'Price' dialog by sending ESCAPE key...")
-                    body_element = driver.find_element(By.XPATH, "//body")
-                    body_element.send_keys(Keys.ESCAPE)
-                    print("      Sent ESCAPE key to close 'Price' dialog.")
-                    time.sleep(2) # Pause for results to refresh after price change
+                    logger.debug("      Attempting to close 'Price' dialog by sending ESCAPE key...")
+                    ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+                    logger.debug("      Sent ESCAPE key to close 'Price' dialog.")
+                    # Wait for the dialog's slider to leave the DOM/viewport
+                    # rather than pausing a fixed 2 seconds.
+                    wait.until(EC.invisibility_of_element_located(PRICE_INPUT))
 
                     search_success_status = "INFO_PRICE_FILTER_APPLIED_PAUSED_FOR_TIMES_INSPECTION"
                     search_message = f"Applied Price filter (max ${traveler_budget}). Paused for Times filter inspection."
-                    print(f"    Successfully applied Price filter (max ${traveler_budget}).")
+                    logger.info("    Successfully applied Price filter (max $%s).", traveler_budget)
 
                 except TimeoutException as e_price_set:
-                    print(f"    Timeout while trying to set price: {e_price_set}")
+                    logger.warning("    Timeout while trying to set price: %s", e_price_set)
                     search_success_status = "ERROR_FILTER_PRICE_SET_TIMEOUT"
                     search_message = f"Timeout setting price filter: {e_price_set}"
                 except Exception as e_price_set_general:
-                    print(f"    Error setting price filter: {e_price_set_general}")
+                    logger.warning("    Error setting price filter: %s", e_price_set_general)
                     search_success_status = "ERROR_FILTER_PRICE_SET_GENERAL"
                     search_message = f"General error setting price filter: {e_price_set_general}"
-            else:
-                print("    No budget specified for traveler, skipping Price filter.")
-                # Update status if price filter is skipped
-                search_success_status = "INFO_PRICE_FILTER_SKIPPED_PAUSED_FOR_TIMES_INSPECTION"
-                search_message = "Price filter skipped (no budget). Paused for Times filter inspection."
 
             # --- Apply Filters: Times (Open Dialog) ---
-            print("    Attempting to open 'Times' filter...")
-            try:
-                times_filter_button_xpath = "//button[.//span[text()='Times'] and starts-with(@aria-label, 'Times')]"
-                print(f"      Locating 'Times' filter button with XPath: {times_filter_button_xpath}")
-                times_button = wait.until(EC.element_to_be_clickable((By.XPATH, times_filter_button_xpath)))
-                times_button.click()
-                print("      Clicked 'Times' filter button.")
-                search_success_status = "INFO_TIMES_FILTER_OPENED_PAUSED_FOR_INPUT_INSPECTION"
-                search_message = "Opened Times filter. Paused for Outbound Times input elements inspection."
-            except TimeoutException as e_filter_times_open:
-                print(f"    Timeout while trying to open 'Times' filter: {e_filter_times_open}")
-                search_success_status = "ERROR_FILTER_TIMES_OPEN_TIMEOUT"
-                search_message = f"Timeout opening 'Times' filter: {e_filter_times_open}"
-            except Exception as e_filter_times_open_general:
-                print(f"    Error opening 'Times' filter: {e_filter_times_open_general}")
-                search_success_status = "ERROR_FILTER_TIMES_OPEN_GENERAL"
-                search_message = f"General error opening 'Times' filter: {e_filter_times_open_general}"
-
-            # This debug pause is now for inspecting the TIMES filter UI elements (outbound departure/arrival)
-            print("DEBUG: Pausing for 120s to inspect OUTBOUND TIMES filter UI elements (after 'Times' filter button click)...")
-            # time.sleep(120) # PAUSE FOR INSPECTING TIMES FILTER UI ELEMENTS
-
-            # --- Apply Times Filters (Outbound Departure & Arrival) ---
-            print("    Applying 'Times' filter settings...")
+            # Same short-circuit as Price: don't open the dialog at all when
+            # the traveler has no time preferences to apply.
             preferred_times = traveler_info.get('preferred_times', {})
-            out_dep_earliest = preferred_times.get('outbound_departure_earliest')
-            out_dep_latest = preferred_times.get('outbound_departure_latest')
-            out_arr_earliest = preferred_times.get('outbound_arrival_earliest')
-            out_arr_latest = preferred_times.get('outbound_arrival_latest')
-
-            times_dialog_xpath_base = "//div[@aria-modal='true' and @role='dialog' and .//h2[text()='Times']]"
-            
-            # Wait for the dialog to be stable.
-            # A specific element within the dialog, e.g., the first input for earliest departure.
-            try:
-                wait.until(EC.presence_of_element_located((By.XPATH, times_dialog_xpath_base + "//input[@aria-label='Earliest departure']")))
-                time.sleep(0.5) # Small pause for elements to be fully rendered
-
-                # Define XPaths for slider components within the active "Outbound" tab
-                # The "Outbound" tab should be active by default.
-                # These XPaths assume the structure within the "Times" dialog.
-
-                departure_slider_track_xpath = times_dialog_xpath_base + "//div[.//span[text()='Departure'] and descendant::input[@aria-label='Earliest departure']]//div[@jscontroller='tbQzUe' and contains(@class, 'VfPpkd-SxecR')][1]"
-                arrival_slider_track_xpath = times_dialog_xpath_base + "//div[.//span[text()='Arrival'] and descendant::input[@aria-label='Earliest arrival']]//div[@jscontroller='tbQzUe' and contains(@class, 'VfPpkd-SxecR')][1]"
-
-                # Outbound Departure Times
-                if out_dep_earliest is not None:
-                    _set_slider_thumb_value(driver, wait,
-                        thumb_xpath=times_dialog_xpath_base + "//div[@jsname='PFprWc' and .//input[@aria-label='Earliest departure']]",
-                        input_xpath=times_dialog_xpath_base + "//input[@aria-label='Earliest departure']",
-                        slider_track_xpath=departure_slider_track_xpath,
-                        target_value=out_dep_earliest,
-                        slider_label="Outbound Earliest Departure")
-                
-                if out_dep_latest is not None:
-                    _set_slider_thumb_value(driver, wait,
-                        thumb_xpath=times_dialog_xpath_base + "//div[@jsname='PFprWc' and .//input[@aria-label='Latest departure']]",
-                        input_xpath=times_dialog_xpath_base + "//input[@aria-label='Latest departure']",
-                        slider_track_xpath=departure_slider_track_xpath, 
-                        target_value=out_dep_latest,
-                        slider_label="Outbound Latest Departure")
-
-                # Outbound Arrival Times
-                if out_arr_earliest is not None:
-                    _set_slider_thumb_value(driver, wait,
-                        thumb_xpath=times_dialog_xpath_base + "//div[@jsname='PFprWc' and .//input[@aria-label='Earliest arrival']]",
-                        input_xpath=times_dialog_xpath_base + "//input[@aria-label='Earliest arrival']",
-                        slider_track_xpath=arrival_slider_track_xpath,
-                        target_value=out_arr_earliest,
-                        slider_label="Outbound Earliest Arrival")
-
-                if out_arr_latest is not None:
-                    _set_slider_thumb_value(driver, wait,
-                        thumb_xpath=times_dialog_xpath_base + "//div[@jsname='PFprWc' and .//input[@aria-label='Latest arrival']]",
-                        input_xpath=times_dialog_xpath_base + "//input[@aria-label='Latest arrival']",
-                        slider_track_xpath=arrival_slider_track_xpath,
-                        target_value=out_arr_latest,
-                        slider_label="Outbound Latest Arrival")
-                
-                # Close Times dialog using ESCAPE key
-                print("      Attempting to close 'Times' dialog by sending ESCAPE key...")
-                # Ensure focus is on an element that can receive key presses, like the body
-                body_element = driver.find_element(By.XPATH, "//body")
-                body_element.send_keys(Keys.ESCAPE)
-                print("      Sent ESCAPE key to close 'Times' dialog.")
-                time.sleep(2) # Pause for results to refresh
-
-                search_success_status = "INFO_ALL_FILTERS_APPLIED" 
-                search_message = "Successfully applied Stops, Price, and Times filters."
-                print("    Successfully applied 'Times' filter and closed dialog.")
-
-            except Exception as e_times_set:
-                print(f"    Error applying Times filter values or closing dialog: {e_times_set}")
-                search_success_status = "ERROR_FILTER_TIMES_SETTING"
-                search_message = f"Error setting Times filter values: {e_times_set}"
+            if not preferred_times:
+                logger.debug("    No preferred times specified for traveler, skipping Times filter entirely.")
+                search_success_status = "INFO_ALL_FILTERS_APPLIED"
+                search_message = "Applied Stops filter; Price/Times skipped where not configured."
+            else:
+                logger.debug("    Attempting to open 'Times' filter...")
+                try:
+                    logger.debug("      Locating 'Times' filter button with locator: %s", TIMES_BTN[1])
+                    times_button = wait.until(lambda d: elements.get(TIMES_BTN))
+                    times_button.click()
+                    logger.debug("      Clicked 'Times' filter button.")
+                    search_success_status = "INFO_TIMES_FILTER_OPENED_PAUSED_FOR_INPUT_INSPECTION"
+                    search_message = "Opened Times filter. Paused for Outbound Times input elements inspection."
+                except TimeoutException as e_filter_times_open:
+                    logger.warning("    Timeout while trying to open 'Times' filter: %s", e_filter_times_open)
+                    search_success_status = "ERROR_FILTER_TIMES_OPEN_TIMEOUT"
+                    search_message = f"Timeout opening 'Times' filter: {e_filter_times_open}"
+                except Exception as e_filter_times_open_general:
+                    logger.warning("    Error opening 'Times' filter: %s", e_filter_times_open_general)
+                    search_success_status = "ERROR_FILTER_TIMES_OPEN_GENERAL"
+                    search_message = f"General error opening 'Times' filter: {e_filter_times_open_general}"
+
+                # Opt-in pause for inspecting the TIMES filter UI elements (outbound departure/arrival)
+                _debug_pause(run_headless, 120, "inspect OUTBOUND TIMES filter UI elements")
+
+                # --- Apply Times Filters (Outbound Departure & Arrival) ---
+                logger.debug("    Applying 'Times' filter settings...")
+
+                # Wait for the dialog to be stable.
+                # A specific element within the dialog, e.g., the first input for earliest departure.
+                try:
+                    # Presence of the first slider input already guarantees the
+                    # dialog has rendered; no extra fixed pause needed. The
+                    # observer-based wait resolves the moment the input lands
+                    # in the DOM; the polled wait is only the CDP fallback.
+                    if not _wait_for_selector_cdp(driver, TIMES_DIALOG_READY[1]):
+                        _wait_for(driver, TIMES_DIALOG_READY)
+
+                    # The "Outbound" tab is active by default; every locator
+                    # comes prebuilt from the module-level TIMES_SLIDERS table.
+                    slider_targets = [(spec, preferred_times.get(times_key))
+                                      for times_key, spec in TIMES_SLIDERS.items()
+                                      if preferred_times.get(times_key) is not None]
+
+                    # Fast path: one script call sets every slider at once
+                    # instead of find/read/drag/verify round trips per thumb.
+                    slider_payload = [{"selector": spec["input_locator"][1], "value": target}
+                                      for spec, target in slider_targets]
+                    failed_selectors = _apply_sliders_batch(driver, slider_payload)
+                    if failed_selectors:
+                        logger.debug("      %d slider(s) need the per-thumb fallback.", len(failed_selectors))
+
+                    # One cache shared by any fallback thumb updates in this
+                    # dialog, so static slider properties are read once.
+                    slider_props_cache = {}
+                    for slider_spec, target in slider_targets:
+                        if slider_spec["input_locator"][1] not in failed_selectors:
+                            continue
+                        _retry_stale(_set_slider_thumb_value, driver, wait, target_value=target,
+                                     props_cache=slider_props_cache, **slider_spec)
+
+                    # Close Times dialog using ESCAPE key. The key goes out as
+                    # one actions RPC with no element fetch, so there is no
+                    # handle for the post-update re-render to invalidate; the
+                    # stale retry stays as a belt-and-braces wrapper.
+                    logger.debug("      Attempting to close 'Times' dialog by sending ESCAPE key...")
+                    _retry_stale(lambda: ActionChains(driver).send_keys(Keys.ESCAPE).perform())
+                    logger.debug("      Sent ESCAPE key to close 'Times' dialog.")
+                    # Wait for the dialog to actually leave the page and the
+                    # results list to come back rather than a fixed 2-second pause.
+                    _wait_for(driver, (By.XPATH, TIMES_DIALOG_XPATH), cond=EC.invisibility_of_element_located)
+                    _wait_for(driver, RESULTS_ITEM)
+
+                    search_success_status = "INFO_ALL_FILTERS_APPLIED" 
+                    search_message = "Successfully applied Stops, Price, and Times filters."
+                    logger.info("    Successfully applied 'Times' filter and closed dialog.")
+
+                except Exception as e_times_set:
+                    logger.warning("    Error applying Times filter values or closing dialog: %s", e_times_set)
+                    search_success_status = "ERROR_FILTER_TIMES_SETTING"
+                    search_message = f"Error setting Times filter values: {e_times_set}"
         
         except TimeoutException as e_filter_stops:
-            print(f"    Timeout while trying to apply 'Stops' filter: {e_filter_stops}")
+            logger.warning("    Timeout while trying to apply 'Stops' filter: %s", e_filter_stops)
             search_success_status = "ERROR_FILTER_STOPS_TIMEOUT"
             search_message = f"Timeout applying 'Stops: Nonstop' filter: {e_filter_stops}"
         except Exception as e_filter_stops_general:
-            print(f"    Error applying 'Stops' filter: {e_filter_stops_general}")
+            logger.warning("    Error applying 'Stops' filter: %s", e_filter_stops_general)
             search_success_status = "ERROR_FILTER_STOPS_GENERAL"
             search_message = f"General error applying 'Stops: Nonstop' filter: {e_filter_stops_general}"
 
@@ -570,9 +1248,7 @@ def find_flights_selenium(trip_period, traveler_info, destination_airports, run_
         flight_results_summary.append({"status": search_success_status, "message": search_message})
         
         # --- VALIDATION STEP 2: After all filters, before data extraction (if any) ---
-        if not run_headless:
-            print("    [VALIDATION 2] All filters applied. Pausing for 30 seconds to verify final filtered results...")
-            time.sleep(30) # Pause to observe final results when not headless
+        _debug_pause(run_headless, 30, "[VALIDATION 2] All filters applied; verify final filtered results")
 
         return flight_results_summary
 
@@ -582,34 +1258,144 @@ def find_flights_selenium(trip_period, traveler_info, destination_airports, run_
     except TimeoutException as e:
         search_success_status = "ERROR_TIMEOUT"
         search_message = f"A timeout occurred: {e}"
-        print(f"    Timeout: {e}")
-        print("DEBUG: Pausing for 60 seconds due to TIMEOUT to allow inspection...")
-        time.sleep(60) # PAUSE FOR DEBUGGING TIMEOUTS
+        logger.warning("    Timeout: %s", e)
+        _debug_pause(run_headless, 60, "TIMEOUT hit; inspect the page")
     except NoSuchElementException as e:
         search_success_status = "ERROR_NO_SUCH_ELEMENT"
         search_message = f"Could not find a critical element: {e}"
-        print(f"    NoSuchElement: {e}")
+        logger.debug("    NoSuchElement: %s", e)
         # driver.save_screenshot("no_such_element_error.png")
-        print("DEBUG: Pausing for 60 seconds to allow inspection of the browser before quit...")
-        time.sleep(60) # PAUSE FOR DEBUGGING
-    except Exception as e:
+        _debug_pause(run_headless, 60, "NoSuchElement hit; inspect the browser before quit")
+    except WebDriverException as e:
+        # Catch only driver-side failures here; programming errors propagate
+        # so callers (and the parallel executor) see the real exception
+        # instead of a generic status record.
         search_success_status = "ERROR_SELENIUM_GENERAL"
         search_message = f"An unexpected error occurred during Selenium automation: {e}"
-        print(f"    Selenium Error: {e}")
+        logger.warning("    Selenium Error: %s", e)
         # driver.save_screenshot("general_selenium_error.png")
     finally:
-        if driver:
+        if owns_driver and driver:
             driver.quit()
-            print("    WebDriver closed.")
+            logger.info("    WebDriver closed.")
     
     # flight_results_summary.append({"status": search_success_status, "message": search_message})
     # return flight_results_summary
     # The actual return is now handled within the try block after data extraction attempt
 
 # --- Main function to be called by main.py (adapter) ---
-def find_flights(trip_period, traveler_info, destination_airports, run_headless=True):
-    # This is the function main.py will call. It now uses Selenium.
-    return find_flights_selenium(trip_period, traveler_info, destination_airports, run_headless=run_headless)
+def find_flights(trip_period, traveler_info, destination_airports, run_headless=True, pool=None):
+    # This is the function main.py will call. It now uses Selenium,
+    # behind an on-disk cache so repeated identical searches are free.
+    key = _query_cache_key(trip_period, traveler_info, destination_airports)
+    cached = _cache.get(key)
+    if cached is not None:
+        logger.info("  [FlightFinder] Cache hit for %s %s to %s",
+                    traveler_info.get('name'), trip_period['start_date_str'], trip_period['end_date_str'])
+        # Cached payloads are orjson blobs; results come back as plain dicts.
+        return orjson.loads(cached)
+
+    with timed("find_flights"):
+        if pool is not None:
+            # Concurrent callers each check a driver out of the shared pool;
+            # drivers are only acquired after the cache miss above, so cache
+            # hits never touch Chrome. The release sits in a finally so a
+            # propagating error can't leak the checkout and starve the pool.
+            driver = pool.acquire()
+            try:
+                results = find_flights_selenium(trip_period, traveler_info, destination_airports,
+                                                run_headless=run_headless, driver=driver)
+            finally:
+                if driver is not None:
+                    pool.release(driver)
+        else:
+            # Reuse the shared driver across back-to-back searches; a cheap
+            # state reset afterwards replaces the quit/relaunch cycle.
+            driver = _get_or_create_driver(headless=run_headless)
+            results = find_flights_selenium(trip_period, traveler_info, destination_airports,
+                                            run_headless=run_headless, driver=driver)
+            if driver is not None:
+                try:
+                    driver.delete_all_cookies()
+                    driver.get("about:blank")
+                except Exception as e_reset:
+                    logger.warning("  [FlightFinder] Shared driver failed to reset, discarding it: %s", e_reset)
+                    _discard_singleton_driver()
+
+    # Only cache real results; error/status records should be retried next run.
+    if results and not any(str(r.get("status", "")).startswith("ERROR") for r in results if isinstance(r, dict)):
+        # orjson serializes dataclass records natively via asdict, so both the
+        # current status dicts and future FlightOption results round-trip.
+        _cache.set(key, orjson.dumps(results, default=_encode_cached_option), expire=_CACHE_EXPIRE_SECONDS)
+    return results
+
+def find_flights_batch(queries, run_headless=True):
+    """Resolves a whole batch of FlightQuery objects in one call.
+
+    Callers should build the full cross-product of trip options x travelers
+    up front and call this once, so a future provider API can fan the
+    searches out server-side in a single request. Until then the searches
+    run concurrently over a FlightFinderPool of headless drivers (Selenium
+    drivers are not thread-safe, so each worker holds its own); the pool
+    cap doubles as the semaphore bounding live Chrome processes.
+
+    Each query fans out over the full origin x destination cartesian product
+    (via itertools.product, which iterates in C), so every route combination
+    is searched rather than just the first pair.
+
+    Args:
+        queries (list[FlightQuery]): All searches to perform.
+        run_headless (bool): Passed through to the Selenium driver setup.
+
+    Returns:
+        list: One result list per query, in the same order as `queries`.
+    """
+    # Expand every query into its (origin, dest) combinations up front,
+    # remembering which query each belongs to so results regroup in order.
+    combos = []
+    for query_index, query in enumerate(queries):
+        trip_period = {
+            'start_date_str': query.depart_date,
+            'end_date_str': query.return_date,
+            'description': f"{query.depart_date} to {query.return_date}",
+        }
+        for origin, dest in product(query.origin_airports, query.destination_airports):
+            traveler_info = {
+                'name': query.traveler_name,
+                'origin_airport_options': [origin],
+                'budget': query.budget,
+                'preferred_times': query.preferred_times or {},
+            }
+            combos.append((query_index, trip_period, traveler_info, dest))
+
+    all_results = [[] for _ in queries]
+    if not combos:
+        return all_results
+
+    max_workers = min(4, len(combos))
+    if max_workers == 1:
+        # Single search: the shared serial driver is cheaper than a pool.
+        query_index, trip_period, traveler_info, dest = combos[0]
+        results = find_flights(trip_period, traveler_info, [dest], run_headless=run_headless)
+        if results:
+            all_results[query_index].extend(results)
+        return all_results
+
+    pool = FlightFinderPool(max_workers=max_workers, headless=run_headless)
+
+    def _search_combo(combo):
+        query_index, trip_period, traveler_info, dest = combo
+        return query_index, find_flights(trip_period, traveler_info, [dest],
+                                         run_headless=run_headless, pool=pool)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for query_index, results in executor.map(_search_combo, combos):
+                if results:
+                    all_results[query_index].extend(results)
+    finally:
+        pool.shutdown()
+    return all_results
 
 if __name__ == '__main__':
     print("Testing flight_finder.py with Selenium (REAL BROWSER AUTOMATION)...")
@@ -1,47 +1,124 @@
 # src/hotel_finder.py
-import time
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import aiohttp
+
+from src.profiling import timed
+
+logger = logging.getLogger(__name__)
 
 # Placeholder for actual hotel searching logic
 
-def find_hotels(trip_period, search_locations, preferred_brands, fallback_options):
-    """Placeholder function to find hotels.
+# Cap on concurrent hotel lookups once real HTTP calls are wired in; keeps
+# the provider from seeing an unbounded burst when many locations fan out.
+_HOTEL_CONCURRENCY = 8
+
+@dataclass
+class HotelQuery:
+    """One hotel search: locations, brand preferences, and a date range."""
+    search_locations: tuple
+    check_in_date: str
+    check_out_date: str
+    preferred_brands: tuple = ()
+    fallback_options: str = "Any"
+
+@dataclass(slots=True)
+class HotelOption:
+    """A single hotel result. Slotted, so hundreds of results stay cheap and
+    sheet rows can be produced with dataclasses.astuple."""
+    search_location_type: str
+    searched_at: str
+    hotel_name: str
+    brand: str
+    check_in_date: str
+    check_out_date: str
+    price_total: str
+    price_per_night: str
+    booking_link: str
+
+async def _search_location(session, sem, trip_period, location, preferred_brands):
+    """Looks up hotels for one search location. Placeholder: where the real
+    provider request will go, there is currently a dummy result; the
+    session/semaphore plumbing is already the shape the real call needs."""
+    async with sem:
+        # Real implementation: await session.get(<provider url>, params=...)
+        logger.debug("    -> Found dummy %s hotel at %s", preferred_brands[0], location['location_name'])
+        return [HotelOption(
+            search_location_type=location['type'],
+            searched_at=location['location_name'],
+            hotel_name=f"Dummy {preferred_brands[0]} {location['location_name']}",
+            brand=preferred_brands[0],
+            check_in_date=trip_period['start_date_str'],
+            check_out_date=trip_period['end_date_str'],
+            price_total="$400 - $700",
+            price_per_night="$200 - $350",
+            booking_link="https://hotels.example.com/dummy_link"
+        )]
+
+async def find_hotels(trip_period, search_locations, preferred_brands, fallback_options):
+    """Finds hotels across all search locations concurrently.
+
+    Still a placeholder for the actual provider calls, but already shaped
+    for them: every location is searched as its own coroutine over one
+    shared aiohttp session, gathered with bounded concurrency, so wiring in
+    real HTTP requests later makes an N-location search cost one round trip
+    of wall time instead of N.
 
     Args:
         trip_period (dict): Contains start_date_str, end_date_str.
-        search_locations (list): List of dicts, each with 'type' ('airport' or 'park_area') 
+        search_locations (list): List of dicts, each with 'type' ('airport' or 'park_area')
                                  and 'location_name' (airport code or area like 'Tusayan, AZ').
         preferred_brands (list): List of preferred hotel brands (e.g., ['Hyatt']).
         fallback_options (str): Fallback search if preferred not found (e.g., "Any").
 
     Returns:
-        list: A list of dummy hotel option dictionaries.
+        list: A list of dummy HotelOption records.
+    """
+    # Lazy %-style args: no string interpolation happens unless DEBUG is on.
+    logger.debug("  [HotelFinder] Searching hotels for dates: %s to %s", trip_period['start_date_str'], trip_period['end_date_str'])
+    logger.debug("                Preferred brands: %s, Fallback: %s", preferred_brands, fallback_options)
+    logger.debug("                Search locations: %s", search_locations)
+
+    if not (search_locations and preferred_brands):
+        logger.warning("    -> Not enough info to search for dummy hotels (need location and brand).")
+        return []
+
+    sem = asyncio.Semaphore(_HOTEL_CONCURRENCY)
+    async with aiohttp.ClientSession() as session:
+        per_location = await asyncio.gather(
+            *(_search_location(session, sem, trip_period, location, preferred_brands)
+              for location in search_locations))
+    return [hotel for hotels in per_location for hotel in hotels]
+
+def find_hotels_sync(trip_period, search_locations, preferred_brands, fallback_options):
+    """Synchronous adapter over find_hotels for non-async callers."""
+    return asyncio.run(find_hotels(trip_period, search_locations, preferred_brands, fallback_options))
+
+def find_hotels_batch(queries):
+    """Resolves a batch of HotelQuery objects in one call.
+
+    Args:
+        queries (list[HotelQuery]): All searches to perform.
+
+    Returns:
+        list: One result list per query, in the same order as `queries`.
     """
-    print(f"  [HotelFinder] Searching hotels for dates: {trip_period['start_date_str']} to {trip_period['end_date_str']}")
-    print(f"                Preferred brands: {preferred_brands}, Fallback: {fallback_options}")
-    print(f"                Search locations: {search_locations}")
-
-    # Simulate API call or scraping delay
-    # time.sleep(0.1)
-
-    hotels_found = []
-    # Simulate finding one Hyatt for the first search location
-    if search_locations and preferred_brands:
-        hotels_found.append({
-            "search_location_type": search_locations[0]['type'],
-            "searched_at": search_locations[0]['location_name'],
-            "hotel_name": f"Dummy {preferred_brands[0]} {search_locations[0]['location_name']}",
-            "brand": preferred_brands[0],
-            "check_in_date": trip_period['start_date_str'],
-            "check_out_date": trip_period['end_date_str'],
-            "price_total": "$400 - $700",
-            "price_per_night": "$200 - $350",
-            "booking_link": "https://hotels.example.com/dummy_link"
-        })
-        print(f"    -> Found dummy {preferred_brands[0]} hotel at {search_locations[0]['location_name']}")
-    else:
-        print("    -> Not enough info to search for dummy hotels (need location and brand).")
-        
-    return hotels_found
+    all_results = []
+    with timed("find_hotels"):
+        for query in queries:
+            trip_period = {
+                'start_date_str': query.check_in_date,
+                'end_date_str': query.check_out_date,
+            }
+            all_results.append(find_hotels_sync(
+                trip_period,
+                list(query.search_locations),
+                list(query.preferred_brands),
+                query.fallback_options
+            ))
+    return all_results
 
 if __name__ == '__main__':
     print("Testing hotel_finder.py...")
@@ -56,6 +133,6 @@ if __name__ == '__main__':
     pref_brands = ['Hyatt']
     fallback = "Any"
 
-    hotels = find_hotels(sample_trip_period, sample_locations, pref_brands, fallback)
+    hotels = find_hotels_sync(sample_trip_period, sample_locations, pref_brands, fallback)
     if hotels:
         print(f"Dummy hotel options: {hotels}") 
\ No newline at end of file
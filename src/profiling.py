@@ -0,0 +1,41 @@
+# src/profiling.py
+import collections
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Opt-in wall-time accounting for finder calls, enabled with TRIP_PROFILE=1.
+# Once the finders make real network calls, these totals show which one
+# dominates and deserves optimization first.
+PROFILE_ENABLED = os.environ.get("TRIP_PROFILE", "0") == "1"
+
+# Accumulated nanoseconds per span name.
+TIMINGS = collections.defaultdict(float)
+
+@contextmanager
+def timed(name):
+    """Accumulates the wall time of the wrapped block under `name`.
+
+    A no-op unless TRIP_PROFILE=1, so production runs pay nothing. Uses
+    time.monotonic_ns(), which is cheaper than time.time() and immune to
+    wall-clock adjustments.
+    """
+    if not PROFILE_ENABLED:
+        yield
+        return
+    start = time.monotonic_ns()
+    try:
+        yield
+    finally:
+        TIMINGS[name] += time.monotonic_ns() - start
+
+def report_timings():
+    """Logs the accumulated span totals, slowest first."""
+    if not TIMINGS:
+        return
+    logger.info("--- Finder timing totals ---")
+    for name, total_ns in sorted(TIMINGS.items(), key=lambda item: -item[1]):
+        logger.info("  %s: %.3fs", name, total_ns / 1e9)
@@ -1,10 +1,15 @@
 import gspread
+import json
+import logging
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from google.oauth2.credentials import Credentials as UserCredentials
 from google.auth.transport.requests import Request
-from google.auth.exceptions import RefreshError
+from google.auth.exceptions import GoogleAuthError, RefreshError
 import os.path
 
+logger = logging.getLogger(__name__)
+
 # Scopes define the permissions the script requests from Google.
 SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets',
@@ -12,89 +17,163 @@ SCOPES = [
 ]
 CREDENTIALS_FILE = 'credentials.json' # Downloaded from Google Cloud Console
 TOKEN_FILE = 'token.json' # Stores user's access and refresh tokens
+SHEET_CACHE_FILE = '.sheet_cache.json' # Maps spreadsheet title -> Drive file ID
+
+def _load_sheet_cache():
+    """Returns the title -> spreadsheet ID map, or {} when missing/corrupt."""
+    try:
+        with open(SHEET_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _save_sheet_cache(cache):
+    """Persists the title -> spreadsheet ID map; failure is non-fatal (the
+    next run just falls back to the by-title lookup)."""
+    try:
+        with open(SHEET_CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        logger.warning("Could not write '%s': %s", SHEET_CACHE_FILE, e)
+
+def _log_google_retry(retry_state):
+    logger.warning("Transient Google API error; retrying (attempt %s)...", retry_state.attempt_number)
+
+# Retries transient Google API failures (429s/5xx surface as gspread APIError)
+# with exponential backoff instead of aborting the whole run on the first one.
+# After the attempts are exhausted the wrapped function returns None, matching
+# the existing error contract callers already handle.
+_google_retry = retry(
+    retry=retry_if_exception_type(gspread.exceptions.APIError),
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    before_sleep=_log_google_retry,
+    retry_error_callback=lambda retry_state: None,
+)
 
+# The authenticated client, cached for the lifetime of the process so repeat
+# callers skip the token load/refresh dance entirely.
+_cached_gc = None
+
+@_google_retry
 def get_authenticated_service():
     """Authenticates with Google Sheets API using OAuth 2.0 for a desktop app.
-    Manages token refresh and user authorization flow.
+    Manages token refresh and user authorization flow. The client is cached
+    module-wide, so only the first call in a run pays for authentication.
     """
-    creds = None
-    # The TOKEN_FILE stores the user's access and refresh tokens, and is
-    # created automatically when the authorization flow completes for the first time.
-    if os.path.exists(TOKEN_FILE):
-        try:
-            creds = UserCredentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
-        except Exception as e:
-            print(f"Error loading token file: {e}. Will attempt to re-authenticate.")
-            creds = None # Force re-authentication
+    global _cached_gc
+    if _cached_gc is not None:
+        return _cached_gc
 
-    # If there are no (valid) credentials available, let the user log in.
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+    # At most two passes: the second happens only after a broken token file
+    # has been removed, so a fresh OAuth flow runs exactly once (the old
+    # recursive fallback could stack interactive flows).
+    for attempt in range(2):
+        creds = None
+        # The TOKEN_FILE stores the user's access and refresh tokens, and is
+        # created automatically when the authorization flow completes for the first time.
+        if os.path.exists(TOKEN_FILE):
             try:
-                print("Credentials expired, attempting to refresh...")
-                creds.refresh(Request())
-                print("Credentials refreshed successfully.")
-            except RefreshError as e:
-                print(f"Error refreshing access token: {e}")
-                print("Please re-authenticate by deleting token.json and running the script again.")
-                # Fall through to re-authorize if refresh fails
-                creds = None 
-            except Exception as e: # Catch any other unexpected error during refresh
-                print(f"Unexpected error during token refresh: {e}")
-                creds = None
-        
-        if not creds or not creds.valid: # Re-check creds validity after potential refresh
-            if os.path.exists(CREDENTIALS_FILE):
-                # Load client secrets from credentials.json
-                # This uses 'google.oauth2.credentials.Credentials.from_authorized_user_info' 
-                # implicitly by gspread.oauth() if token.json is not found or invalid.
-                # For a desktop app, gspread.oauth() will initiate the flow.
-                print("No valid token found, initiating new OAuth2 flow...")
+                creds = UserCredentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+            except (ValueError, OSError) as e: # Malformed or unreadable token file
+                logger.warning("Error loading token file: %s. Will attempt to re-authenticate.", e)
+                creds = None # Force re-authentication
+
+        # If there are no (valid) credentials available, let the user log in.
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
                 try:
-                    # gspread.oauth() handles the desktop app flow,
-                    # including prompting the user to authorize in their browser
-                    # and saving the new token to TOKEN_FILE (default location).
-                    gc = gspread.oauth(
-                        credentials_filename=CREDENTIALS_FILE,
-                        authorized_user_filename=TOKEN_FILE,
-                        scopes=SCOPES
-                    )
-                    print(f"Authentication successful. Token saved to {TOKEN_FILE}")
-                    return gc
-                except Exception as e:
-                    print(f"Error during OAuth flow: {e}")
-                    print(f"Please ensure '{CREDENTIALS_FILE}' is correctly configured and in the project root.")
+                    logger.info("Credentials expired, attempting to refresh...")
+                    creds.refresh(Request())
+                    logger.info("Credentials refreshed successfully.")
+                except RefreshError as e:
+                    logger.warning("Error refreshing access token: %s", e)
+                    logger.warning("Please re-authenticate by deleting token.json and running the script again.")
+                    # Fall through to re-authorize if refresh fails
+                    creds = None
+                except GoogleAuthError as e: # Any other auth-layer failure during refresh
+                    logger.warning("Unexpected error during token refresh: %s", e)
+                    creds = None
+
+            if not creds or not creds.valid: # Re-check creds validity after potential refresh
+                if os.path.exists(CREDENTIALS_FILE):
+                    # Load client secrets from credentials.json
+                    # This uses 'google.oauth2.credentials.Credentials.from_authorized_user_info'
+                    # implicitly by gspread.oauth() if token.json is not found or invalid.
+                    # For a desktop app, gspread.oauth() will initiate the flow.
+                    logger.info("No valid token found, initiating new OAuth2 flow...")
+                    try:
+                        # gspread.oauth() handles the desktop app flow,
+                        # including prompting the user to authorize in their browser
+                        # and saving the new token to TOKEN_FILE (default location).
+                        gc = gspread.oauth(
+                            credentials_filename=CREDENTIALS_FILE,
+                            authorized_user_filename=TOKEN_FILE,
+                            scopes=SCOPES
+                        )
+                        logger.info("Authentication successful. Token saved to %s", TOKEN_FILE)
+                        _cached_gc = gc
+                        return gc
+                    except Exception as e:
+                        logger.warning("Error during OAuth flow: %s", e)
+                        logger.warning("Please ensure '%s' is correctly configured and in the project root.", CREDENTIALS_FILE)
+                        return None
+                else:
+                    logger.warning("Error: '%s' not found. Please download it from Google Cloud Console.", CREDENTIALS_FILE)
                     return None
-            else:
-                print(f"Error: '{CREDENTIALS_FILE}' not found. Please download it from Google Cloud Console.")
-                return None
-        
-    # If we got here, creds should be valid (either loaded or refreshed)
-    # We need to return a gspread Client object authorized with these UserCredentials
-    try:
-        gc = gspread.Client(auth=creds)
-        # Test the connection by listing spreadsheets to ensure creds are working with gspread.Client
-        gc.list_spreadsheet_files() 
-        print("Successfully authenticated with existing token.")
-        return gc
-    except Exception as e:
-        print(f"Error creating gspread client with existing credentials: {e}")
-        print("Attempting to re-authenticate.")
-        # If gspread.Client fails with existing creds, try the full oauth flow again
-        # by removing the potentially problematic token file.
-        if os.path.exists(TOKEN_FILE):
-            os.remove(TOKEN_FILE)
-        return get_authenticated_service() # Recursive call to re-initiate flow
+
+        # If we got here, creds should be valid (either loaded or refreshed)
+        # We need to return a gspread Client object authorized with these UserCredentials
+        try:
+            gc = gspread.Client(auth=creds)
+            # No connectivity probe here: listing spreadsheets just to test the
+            # client is a full O(N) Drive search per startup. creds.valid was
+            # checked above, and the first real call (create_spreadsheet) already
+            # handles API failures, so defer any network error to that point.
+            logger.info("Successfully authenticated with existing token.")
+            _cached_gc = gc
+            return gc
+        except gspread.exceptions.APIError:
+            raise # Transient Google-side failure; let the retry decorator handle it.
+        except Exception as e:
+            logger.warning("Error creating gspread client with existing credentials: %s", e)
+            logger.info("Attempting to re-authenticate.")
+            # If gspread.Client fails with existing creds, remove the
+            # potentially problematic token file and take one more pass
+            # through the loop with a clean slate.
+            if os.path.exists(TOKEN_FILE):
+                os.remove(TOKEN_FILE)
+
+    logger.warning("Authentication failed after retrying with a fresh token.")
+    return None
 
 
+@_google_retry
 def create_spreadsheet(gc, title, folder_id=None):
     """Creates a new spreadsheet with the given title.
     Optionally creates it within the specified folder_id.
     Returns the spreadsheet object or None if creation fails.
     """
     if not gc:
-        print("Authentication failed, cannot create spreadsheet.")
+        logger.warning("Authentication failed, cannot create spreadsheet.")
         return None
+
+    # Resolve a previously seen title straight to its ID: open_by_key is a
+    # single O(1) fetch, whereas gc.open(title) runs a Drive name search
+    # (~300-800ms and "search" quota) on every invocation.
+    sheet_cache = _load_sheet_cache()
+    cached_id = sheet_cache.get(title)
+    if cached_id:
+        try:
+            spreadsheet = gc.open_by_key(cached_id)
+            logger.info("Spreadsheet '%s' opened from cached ID. URL: %s", title, spreadsheet.url)
+            return spreadsheet
+        except (gspread.exceptions.SpreadsheetNotFound, gspread.exceptions.APIError):
+            # Sheet was deleted or the ID went stale; fall through to the
+            # by-title lookup and refresh the cache below.
+            logger.warning("Cached ID for '%s' is stale; falling back to title lookup.", title)
+            sheet_cache.pop(title, None)
+
     try:
         # Check if spreadsheet already exists (gspread.open does not use folder_id for lookup)
         # If it exists anywhere, it will be opened. If you need to ensure it's in the specific folder
@@ -102,37 +181,97 @@ def create_spreadsheet(gc, title, folder_id=None):
         # For now, we assume if it exists with this name, we use it.
         try:
             spreadsheet = gc.open(title)
-            print(f"Spreadsheet '{title}' already exists (opened). URL: {spreadsheet.url}")
+            logger.info("Spreadsheet '%s' already exists (opened). URL: %s", title, spreadsheet.url)
             # Note: If it already exists, this doesn't move it to the folder_id.
             # If you want to ensure it's in the folder, or move it, that's an additional step.
+            sheet_cache[title] = spreadsheet.id
+            _save_sheet_cache(sheet_cache)
             return spreadsheet
         except gspread.exceptions.SpreadsheetNotFound:
-            print(f"Spreadsheet '{title}' not found. Creating new one...")
-            try:
-                spreadsheet = gc.create(title, folder_id=folder_id) # Use folder_id here
-                print(f"Spreadsheet '{title}' created successfully in folder_id: '{folder_id if folder_id else 'root'}'.")
-                print(f"You can view it at: {spreadsheet.url}")
-            except Exception as e:
-                print(f"Error creating spreadsheet with folder_id '{folder_id}': {e}")
-                if folder_id: # Only attempt fallback if a folder_id was actually provided
-                    print("Attempting to create spreadsheet in root directory instead (fallback).")
+            logger.info("Spreadsheet '%s' not found. Creating new one...", title)
+            if folder_id is None:
+                # No folder requested: the root "fallback" would be the exact
+                # same call as the one that just failed, so create in root
+                # directly and treat any failure as fatal.
+                try:
+                    spreadsheet = gc.create(title)
+                    logger.info("Spreadsheet '%s' created successfully in root.", title)
+                    logger.info("You can view it at: %s", spreadsheet.url)
+                except Exception as e:
+                    logger.warning("Error creating spreadsheet: %s", e)
+                    return None
+            else:
+                try:
+                    spreadsheet = gc.create(title, folder_id=folder_id) # Use folder_id here
+                    logger.info("Spreadsheet '%s' created successfully in folder_id: '%s'.", title, folder_id)
+                    logger.info("You can view it at: %s", spreadsheet.url)
+                except Exception as e:
+                    logger.warning("Error creating spreadsheet with folder_id '%s': %s", folder_id, e)
+                    logger.info("Attempting to create spreadsheet in root directory instead (fallback).")
                     try:
                         spreadsheet = gc.create(title) # Fallback to root
-                        print(f"Spreadsheet '{title}' created successfully in root (fallback).")
-                        print(f"You can view it at: {spreadsheet.url}")
+                        logger.info("Spreadsheet '%s' created successfully in root (fallback).", title)
+                        logger.info("You can view it at: %s", spreadsheet.url)
                     except Exception as e2:
-                        print(f"Fallback creation in root also failed: {e2}")
+                        logger.warning("Fallback creation in root also failed: %s", e2)
                         return None
-                else: # No folder_id was specified, and initial creation failed.
-                    return None
             
             # Removed problematic sharing logic here as the creator is the owner.
+            sheet_cache[title] = spreadsheet.id
+            _save_sheet_cache(sheet_cache)
             return spreadsheet # Return the successfully created spreadsheet
 
+    except gspread.exceptions.APIError:
+        raise # Transient Google-side failure; let the retry decorator handle it.
     except Exception as e:
-        print(f"An error occurred while creating or opening the spreadsheet: {e}")
+        logger.warning("An error occurred while creating or opening the spreadsheet: %s", e)
         return None
 
+def write_trip_data_batch(spreadsheet, flights_rows, cars_rows, hotels_rows):
+    """Writes all collected trip data to the spreadsheet in one batched call.
+
+    Takes pre-flattened 2-D row lists (one per section) and issues a single
+    values batchUpdate with one range per section, instead of one write per
+    trip option. Per-trip writes would quickly trip the Sheets
+    WriteRequestsPerMinutePerUser quota (60/min); a single batched update is
+    one request and one round trip regardless of how many options were
+    collected.
+
+    Returns True on success (including the nothing-to-write case), False otherwise.
+    """
+    if not spreadsheet:
+        logger.warning("No spreadsheet available, skipping sheet write.")
+        return False
+
+    sections = [("Flights", flights_rows), ("Cars", cars_rows), ("Hotels", hotels_rows)]
+    data = []
+    for title, rows in sections:
+        if not rows:
+            continue
+        # Make sure the target worksheet exists before addressing a range in it.
+        try:
+            spreadsheet.worksheet(title)
+        except gspread.exceptions.WorksheetNotFound:
+            try:
+                spreadsheet.add_worksheet(title=title, rows=max(len(rows) + 10, 100), cols=26)
+            except Exception as e:
+                logger.warning("Error creating worksheet '%s': %s", title, e)
+                return False
+        data.append({"range": f"{title}!A2", "values": rows})
+
+    if not data:
+        logger.info("No trip data rows to write to the sheet.")
+        return True
+
+    try:
+        spreadsheet.values_batch_update(body={"valueInputOption": "RAW", "data": data})
+        total_rows = sum(len(rows) for _, rows in sections)
+        logger.info("Wrote %s rows to '%s' in a single batched update.", total_rows, spreadsheet.title)
+        return True
+    except Exception as e:
+        logger.warning("Error writing batched trip data to the sheet: %s", e)
+        return False
+
 if __name__ == '__main__':
     # This part is for testing the module directly
     print("Testing sheets_manager.py...")
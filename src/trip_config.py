@@ -0,0 +1,51 @@
+# src/trip_config.py
+import logging
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, field_validator
+
+logger = logging.getLogger(__name__)
+
+# The trip length options main.py knows how to expand into date ranges.
+VALID_TRIP_LENGTH_OPTIONS = ("none", "friday_off", "monday_off")
+
+# Typed schema for trip_config.yaml. Validating once at load time means the
+# rest of the code does plain attribute reads instead of repeated dict.get
+# calls, and bad config surfaces as one clear error up front instead of a
+# ValueError somewhere mid-loop.
+
+class TravelerInfo(BaseModel):
+    name: str
+    origin_city: str = ""
+    origin_airport_options: list[str] = []
+    budget: Optional[int] = None
+    preferred_times: dict = {}
+
+class ParkInfo(BaseModel):
+    name: str = ""
+    hotel_search_area: Optional[str] = None
+
+class TripConfig(BaseModel):
+    trip_name: str = ""
+    output_sheet_name: str = "Default Trip Planning Sheet"
+    # pydantic parses the YYYY-MM-DD strings straight into date objects,
+    # so no separate strptime pass is needed.
+    weekend_dates: list[date] = []
+    trip_length_options: list[str] = []
+    travelers: list[TravelerInfo] = []
+    destination_airport_options: list[str] = []
+    destination_parks: list[ParkInfo] = []
+    preferred_hotel_brands: list[str] = []
+    fallback_hotel_options: str = "Any"
+
+    @field_validator("trip_length_options")
+    @classmethod
+    def _drop_unknown_length_options(cls, value):
+        """Filters out unknown options with one warning each at load time,
+        so the trip-period loop can assume every entry is valid instead of
+        re-checking (and re-warning) per weekend date."""
+        for bad in value:
+            if bad not in VALID_TRIP_LENGTH_OPTIONS:
+                logger.warning("Unknown trip length option '%s' in config; ignoring.", bad)
+        return [v for v in value if v in VALID_TRIP_LENGTH_OPTIONS]